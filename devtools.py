@@ -60,7 +60,7 @@ from zhongsheng.recruit import (
     resolve_recruit_languages,
 )
 from ziwen_lookup.cache_helpers import get_cjk_cache_top_entries
-from ziwen_lookup.ja import ja_character, ja_word
+from ziwen_lookup.ja import close_client_session, ja_character, ja_word
 from ziwen_lookup.ko import ko_word
 from ziwen_lookup.match_helpers import lookup_matcher
 from ziwen_lookup.wiktionary import format_wiktionary_markdown, wiktionary_search
@@ -727,8 +727,15 @@ def check_ziwen_lookup_ja_character() -> None:
 def check_ziwen_lookup_ja_word() -> None:
     """ja: Look up a Japanese word."""
     my_test = input("Enter a Japanese word to look up: ")
+
+    async def _lookup() -> str:
+        try:
+            return await ja_word(my_test)
+        finally:
+            await close_client_session()
+
     with msg.loading(f"Looking up '{my_test}'..."):
-        result = asyncio.run(ja_word(my_test))
+        result = asyncio.run(_lookup())
     _print_lookup(result, f"No results found for '{my_test}'")
 
 
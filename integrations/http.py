@@ -2,11 +2,17 @@
 # -*- coding: UTF-8 -*-
 """Shared policy and request helpers for HTTP integrations."""
 
+from collections.abc import Mapping
+
+import requests
 from random_user_agent.params import OperatingSystem, SoftwareName
 from random_user_agent.user_agent import UserAgent
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 DEFAULT_HTTP_TIMEOUT: tuple[int, int] = (5, 15)
 DISCORD_HTTP_TIMEOUT: tuple[int, int] = (5, 20)
+RETRY_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
 
 
 def get_random_useragent() -> dict[str, str]:
@@ -26,3 +32,37 @@ def get_random_useragent() -> dict[str, str]:
             "application/xml;q=0.9,image/webp,*/*;q=0.8"
         ),
     }
+
+
+def create_pooled_session(
+    headers: Mapping[str, str] | None = None,
+    pool_connections: int = 10,
+    pool_maxsize: int = 20,
+    retries: int = 3,
+    backoff_factor: float = 0.3,
+) -> requests.Session:
+    """
+    Return a requests session that keeps connections alive between calls
+    and retries transient server errors with exponential backoff.
+
+    After the final retry the last response is returned rather than raised,
+    so callers can keep using `raise_for_status()` as with `requests.get`.
+    """
+    retry_policy = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=sorted(RETRY_STATUS_CODES),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry_policy,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
@@ -175,28 +175,14 @@ def _deduplicate_args(args: list) -> list:
     if not args:
         return args
 
-    seen = set()
-    result = []
-
+    # Lingvo objects are keyed by language name; tuples (lookup_cjk format:
+    # (lang, term) or (lang, term, explicit)) and strings are hashable and
+    # key themselves. The first argument for each key is kept.
+    unique: dict = {}
     for arg in args:
-        # Handle Lingvo objects
-        if hasattr(arg, "name"):
-            key = arg.name
-            if key not in seen:
-                seen.add(key)
-                result.append(arg)
-        # Handle tuples (lookup_cjk format: (lang, term) or (lang, term, explicit))
-        elif isinstance(arg, tuple):
-            if arg not in seen:  # Tuples are hashable - can use directly
-                seen.add(arg)
-                result.append(arg)
-        # Handle strings
-        else:
-            if arg not in seen:
-                seen.add(arg)
-                result.append(arg)
+        unique.setdefault(arg.name if hasattr(arg, "name") else arg, arg)
 
-    return result
+    return list(unique.values())
 
 
 def _extract_text_within_curly_braces(text: str) -> list[tuple[str, str | None]]:
@@ -108,13 +108,8 @@ def _serialize_komandos(text: str) -> str:
     "not in cache at all" (the latter returns None from _get_cached_comment).
     """
     commands = extract_commands_from_text(text)
-    seen: set[str] = set()
-    names: list[str] = []
-    for cmd in commands:
-        if cmd.name not in seen:
-            seen.add(cmd.name)
-            names.append(cmd.name)
-    return ",".join(names)
+    # dict.fromkeys keeps the first occurrence of each name, in order.
+    return ",".join(dict.fromkeys(cmd.name for cmd in commands))
 
 
 def _deserialize_komandos(komandos_str: str) -> set[str]:
@@ -26,6 +26,7 @@ Requirements (beyond the project's own deps):
     pip install pytest pytest-asyncio
 """
 
+import asyncio
 import re
 
 import pytest
@@ -743,7 +744,7 @@ class TestEndToEndPipeline:
         assert "ja" in matched
 
         # 2. Fetch fresh from source (bypass cache)
-        output = _ja_character_fetch("覚")
+        output = asyncio.run(_ja_character_fetch("覚"))
         assert output and "覚" in output
 
         # 3. Parse
@@ -44,6 +44,11 @@ def _strip_cache_marker(text: str) -> str:
     return text.replace(" ^⚡", "").strip()
 
 
+def _entries(data: dict[str, list[dict]]) -> list[dict]:
+    """Flatten _ko_search_raw's part-of-speech groups into one entry list."""
+    return [entry for group in data.values() for entry in group]
+
+
 def _assert_romanization(output: str, context: str) -> None:
     """Assert a **Romanization:** line is present."""
     assert re.search(r"\*\*Romanization:\*\*", output), (
@@ -168,17 +173,17 @@ class TestLookupMatcherKo:
 class TestKoSearchRaw:
     """Unit-style tests for _ko_search_raw (live API, no formatting)."""
 
-    def test_bulgil_returns_list(self):
-        """불길 – raw search must return a non-empty list."""
+    def test_bulgil_returns_groups(self):
+        """불길 – raw search must return non-empty part-of-speech groups."""
         data = _ko_search_raw("불길")
-        assert isinstance(data, list) and len(data) > 0, (
-            f"Expected non-empty list for 불길, got: {data}"
+        assert isinstance(data, dict) and len(data) > 0, (
+            f"Expected non-empty groups for 불길, got: {data}"
         )
 
     def test_bulgil_word_field(self):
         """불길 – every entry must have word == '불길'."""
         data = _ko_search_raw("불길")
-        for entry in data:
+        for entry in _entries(data):
             assert entry["word"] == "불길", (
                 f"Entry word mismatch: expected '불길', got '{entry['word']}'"
             )
@@ -186,13 +191,13 @@ class TestKoSearchRaw:
     def test_bulgil_no_origin(self):
         """불길 – native Korean word should have no origin field."""
         data = _ko_search_raw("불길")
-        origins = [e.get("origin") for e in data if e.get("origin")]
+        origins = [e.get("origin") for e in _entries(data) if e.get("origin")]
         assert not origins, f"Expected no origin for native Korean 불길; got: {origins}"
 
     def test_daiji_is_noun(self):
         """대지 – part_of_speech should be '명사' (noun)."""
         data = _ko_search_raw("대지")
-        pos_values = [e["part_of_speech"] for e in data]
+        pos_values = [e["part_of_speech"] for e in _entries(data)]
         assert "명사" in pos_values, (
             f"Expected '명사' in part_of_speech for 대지; got: {pos_values}"
         )
@@ -200,7 +205,7 @@ class TestKoSearchRaw:
     def test_himchada_is_adjective(self):
         """힘차다 – part_of_speech should be '형용사' (adjective)."""
         data = _ko_search_raw("힘차다")
-        pos_values = [e["part_of_speech"] for e in data]
+        pos_values = [e["part_of_speech"] for e in _entries(data)]
         assert "형용사" in pos_values, (
             f"Expected '형용사' in part_of_speech for 힘차다; got: {pos_values}"
         )
@@ -208,7 +213,7 @@ class TestKoSearchRaw:
     def test_himchada_no_origin(self):
         """힘차다 – native Korean word should have no origin field."""
         data = _ko_search_raw("힘차다")
-        origins = [e.get("origin") for e in data if e.get("origin")]
+        origins = [e.get("origin") for e in _entries(data) if e.get("origin")]
         assert not origins, (
             f"Expected no origin for native Korean 힘차다; got: {origins}"
         )
@@ -216,18 +221,13 @@ class TestKoSearchRaw:
     def test_definitions_have_english_translations(self):
         """세계 – definitions must include at least one 영어 translation."""
         data = _ko_search_raw("세계")
-        english_found = False
-        for entry in data:
-            for defn in entry.get("definitions", []):
-                for t in defn.get("translations", []):
-                    if t.get("language") == "영어":
-                        english_found = True
-        assert english_found, "Expected at least one 영어 translation for 세계"
-
-    def test_invalid_word_returns_empty_list(self):
-        """A nonsense Hangul string should return an empty list gracefully."""
+        english_found = any(e["english_definitions"] for e in _entries(data))
+        assert english_found, "Expected at least one English gloss for 세계"
+
+    def test_invalid_word_returns_empty_groups(self):
+        """A nonsense Hangul string should return no groups gracefully."""
         data = _ko_search_raw("ㅎㅎㅎㅎ")
-        assert data == [], f"Expected empty list for invalid input, got: {data}"
+        assert data == {}, f"Expected no groups for invalid input, got: {data}"
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -10,7 +10,7 @@ from datetime import date
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Protocol
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 
 class FakeNotFound(Exception):
@@ -360,11 +360,13 @@ def _common_stubs(monkeypatch) -> dict[str, types.ModuleType]:
         "ziwen_lookup": _make_stub_module("ziwen_lookup"),
         "ziwen_lookup.ja": _make_stub_module(
             "ziwen_lookup.ja",
-            ja_character=MagicMock(return_value="ja character"),
+            close_client_session=AsyncMock(),
+            ja_character_async=MagicMock(return_value="ja character"),
             ja_word=MagicMock(return_value="ja word"),
         ),
         "ziwen_lookup.ko": _make_stub_module(
-            "ziwen_lookup.ko", ko_word=MagicMock(return_value="ko word")
+            "ziwen_lookup.ko",
+            ko_words_bulk=AsyncMock(return_value={"ko": "ko word"}),
         ),
         "ziwen_lookup.wiktionary": _make_stub_module(
             "ziwen_lookup.wiktionary",
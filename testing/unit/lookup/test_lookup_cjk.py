@@ -14,6 +14,7 @@ import asyncio
 import sys
 import types
 import unittest
+from collections import OrderedDict
 from unittest.mock import MagicMock, Mock, patch
 
 from ziwen_lookup.cache_helpers import (format_ja_character_from_cache,
@@ -85,6 +86,33 @@ class TestZhVariantSearch(unittest.TestCase):
         )
 
 
+class TestZhScriptConversion(unittest.TestCase):
+    """OpenCC converters should be loaded once and reused."""
+
+    def test_converter_is_shared_across_calls(self):
+        import ziwen_lookup.zh as zh
+
+        zh._opencc_converter.cache_clear()
+        try:
+            with patch("ziwen_lookup.zh.opencc.OpenCC") as opencc_cls:
+                opencc_cls.return_value.convert.side_effect = lambda text: text
+                zh.simplify("鬥爭")
+                zh.simplify("團結")
+                zh.tradify("斗争")
+
+            self.assertEqual(
+                [c.args for c in opencc_cls.call_args_list],
+                [("t2s.json",), ("s2tw.json",)],
+            )
+        finally:
+            zh._opencc_converter.cache_clear()
+
+    def test_simplify_converts_traditional_text(self):
+        import ziwen_lookup.zh as zh
+
+        self.assertEqual(zh.simplify("鬥爭"), "斗争")
+
+
 class TestZhCalligraphySearch(unittest.TestCase):
     """Tests for bounded SFZD retries and same-run fallback resources."""
 
@@ -350,6 +378,16 @@ class TestZhJaTokenizer(unittest.TestCase):
         for token in result:
             self.assertRegex(token, r"[\u2E80-\u9FFF]")
 
+    @_skip_on_error
+    def test_zh_simplified_and_traditional_split_alike(self):
+        """Traditional input is split like its Simplified form, keeping its characters."""
+        self.assertEqual(
+            lookup_zh_ja_tokenizer("\u6700\u540E\u7684\u6597\u4E89", "zh"), ["\u6700\u540E", "\u7684", "\u6597\u4E89"]
+        )
+        self.assertEqual(
+            lookup_zh_ja_tokenizer("\u6700\u5F8C\u7684\u9B25\u722D", "zh"), ["\u6700\u5F8C", "\u7684", "\u9B25\u722D"]
+        )
+
     @_skip_on_error
     def test_zh_chengyu_four_chars(self):
         """Four-character idiom-length string tokenizes without error."""
@@ -427,6 +465,102 @@ class TestZhJaTokenizer(unittest.TestCase):
         self.assertIsInstance(result, list)
         self.assertEqual(result, [])
 
+    def test_ja_tagger_is_loaded_once(self):
+        """The MeCab tagger (and its dictionary) is shared across calls."""
+        import ziwen_lookup.match_helpers as match_helpers
+
+        tagger = MagicMock()
+        tagger.parse.side_effect = lambda phrase: f"{phrase} \n"
+        with (
+            patch.object(match_helpers, "_ja_tagger", None),
+            patch.object(
+                match_helpers.MeCab, "Tagger", return_value=tagger
+            ) as tagger_cls,
+        ):
+            first = lookup_zh_ja_tokenizer("覚悟", "ja")
+            second = lookup_zh_ja_tokenizer("暁", "ja")
+
+        tagger_cls.assert_called_once()
+        self.assertEqual(first, ["覚悟"])
+        self.assertEqual(second, ["暁"])
+
+    def test_ja_parse_output_split_into_surfaces(self):
+        """Surfaces come from the wakati output, dropping lone hiragana."""
+        import ziwen_lookup.match_helpers as match_helpers
+
+        tagger = MagicMock()
+        tagger.parse.return_value = "覚悟 を 決め 。 \n"
+        with patch.object(match_helpers, "_ja_tagger", tagger):
+            result = lookup_zh_ja_tokenizer("覚悟を決め。", "ja")
+
+        tagger.parse.assert_called_once_with("覚悟を決め。")
+        self.assertEqual(result, ["覚悟", "決め"])
+
+    def test_ja_runs_match_per_run_parsing(self):
+        """Each Japanese run is segmented as it would be on its own."""
+        import ziwen_lookup.match_helpers as match_helpers
+
+        try:
+            with match_helpers._ja_tagger_lock:
+                match_helpers._get_ja_tagger()
+        except Exception as e:
+            self.skipTest(f"Dependency not available: {e}")
+
+        runs = ["かな", "天気", "覚悟を決め"]
+        comment = " and ".join(f"`{run}`" for run in runs)
+        expected = [
+            (token, False)
+            for run in runs
+            for token in lookup_zh_ja_tokenizer(run, "ja")
+        ]
+
+        self.assertEqual(lookup_matcher(comment, "ja")["ja"], expected)
+
+class TestCallSyncAsync(unittest.TestCase):
+    """Sync callables should run off the event loop with all their arguments."""
+
+    def test_sync_function_runs_in_thread_with_kwargs(self):
+        import threading
+
+        from ziwen_lookup.async_helpers import call_sync_async
+
+        def work(word, *, suffix):
+            return word + suffix, threading.current_thread()
+
+        result, thread = asyncio.run(call_sync_async(work, "투쟁", suffix="!"))
+
+        self.assertEqual(result, "투쟁!")
+        self.assertIsNot(thread, threading.main_thread())
+
+
+class _ForbiddenAiohttpSession:
+    """Stand-in aiohttp session whose every GET returns HTTP 403."""
+
+    def __init__(self, *args, **kwargs):
+        self.urls = []
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def get(self, url, **kwargs):
+        import aiohttp
+
+        self.urls.append(url)
+        response = MagicMock()
+        response.raise_for_status.side_effect = aiohttp.ClientResponseError(
+            request_info=Mock(), history=(), status=403, message="Forbidden"
+        )
+        context = MagicMock()
+        context.__aenter__.return_value = response
+        return context
+
 
 class TestJaNameSearch(unittest.TestCase):
     """The optional Japanese name source should fail softly."""
@@ -434,15 +568,11 @@ class TestJaNameSearch(unittest.TestCase):
     def test_http_error_returns_none(self):
         import ziwen_lookup.ja as ja
 
-        response = Mock()
-        response.raise_for_status.side_effect = ja.requests.HTTPError(
-            "403 Client Error: Forbidden"
-        )
-
-        with patch("ziwen_lookup.ja.requests.get", return_value=response):
-            result = ja._ja_name_search("玉峰")
+        session = _ForbiddenAiohttpSession()
+        result = asyncio.run(ja._ja_name_search(session, "玉峰"))
 
         self.assertIsNone(result)
+        self.assertEqual(session.urls, ["https://kanji.reader.bz/玉峰"])
 
     def test_http_error_allows_word_lookup_to_continue_to_character_fallback(self):
         import ziwen_lookup.ja as ja
@@ -450,22 +580,290 @@ class TestJaNameSearch(unittest.TestCase):
         async def no_jisho_result(_session, _url):
             return None
 
-        response = Mock()
-        response.raise_for_status.side_effect = ja.requests.HTTPError(
-            "403 Client Error: Forbidden"
-        )
-
         with (
             patch("ziwen_lookup.ja.fetch_json", new=no_jisho_result),
-            patch("ziwen_lookup.ja.requests.get", return_value=response),
+            patch("ziwen_lookup.ja.aiohttp.ClientSession", _ForbiddenAiohttpSession),
             patch("ziwen_lookup.ja._sfx_search", return_value=None),
-            patch("ziwen_lookup.ja.ja_character", return_value="character fallback"),
+            patch("ziwen_lookup.ja.ja_character_async", return_value="character fallback"),
         ):
             result = asyncio.run(ja._ja_word_fetch("玉峰"))
 
         self.assertEqual(result, "character fallback")
 
 
+class TestJaWordFallbacks(unittest.TestCase):
+    """Fallback probes after a Jisho miss run together in priority order."""
+
+    def test_name_result_cancels_pending_sfx_probe(self):
+        import ziwen_lookup.ja as ja
+
+        sfx_cancelled = []
+
+        async def no_jisho_result(_session, _url):
+            return None
+
+        async def found_name(_session, _name):
+            return "name result"
+
+        async def slow_sfx(_func, _word):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                sfx_cancelled.append(True)
+                raise
+
+        with (
+            patch.object(ja, "_get_client_session"),
+            patch.object(ja, "fetch_json", new=no_jisho_result),
+            patch.object(ja, "_ja_name_search", new=found_name),
+            patch.object(ja, "call_sync_async", new=slow_sfx),
+        ):
+            result = asyncio.run(ja._ja_word_fetch("ドン"))
+
+        self.assertEqual(result, "name result")
+        self.assertEqual(sfx_cancelled, [True])
+
+    def test_sfx_result_waits_for_higher_priority_name_probe(self):
+        import ziwen_lookup.ja as ja
+
+        async def no_jisho_result(_session, _url):
+            return None
+
+        async def slow_name(_session, _name):
+            await asyncio.sleep(0.01)
+            return "name result"
+
+        async def quick_sfx(_func, _word):
+            return "sfx result"
+
+        with (
+            patch.object(ja, "_get_client_session"),
+            patch.object(ja, "fetch_json", new=no_jisho_result),
+            patch.object(ja, "_ja_name_search", new=slow_name),
+            patch.object(ja, "call_sync_async", new=quick_sfx),
+        ):
+            result = asyncio.run(ja._ja_word_fetch("ドン"))
+
+        self.assertEqual(result, "name result")
+
+
+class TestJaSfxSearch(unittest.TestCase):
+    """The SFX lookup should share one headless browser across calls."""
+
+    def setUp(self):
+        import ziwen_lookup.ja as ja
+
+        self.ja = ja
+        ja._sfx_driver = None
+
+    def tearDown(self):
+        self.ja._sfx_driver = None
+
+    def test_browser_is_launched_once_across_lookups(self):
+        driver = MagicMock()
+        driver.page_source = "<html><body><main></main></body></html>"
+
+        with (
+            patch("selenium.webdriver.Chrome", return_value=driver) as chrome,
+            patch("selenium.webdriver.support.ui.WebDriverWait"),
+        ):
+            self.ja._sfx_search("ドキドキ")
+            self.ja._sfx_search("ワクワク")
+
+        chrome.assert_called_once()
+        self.assertEqual(driver.get.call_count, 2)
+        driver.quit.assert_not_called()
+
+    def test_browser_failure_discards_driver(self):
+        driver = MagicMock()
+        driver.get.side_effect = RuntimeError("browser crashed")
+
+        with (
+            patch("selenium.webdriver.Chrome", return_value=driver),
+            patch("selenium.webdriver.support.ui.WebDriverWait"),
+        ):
+            result = self.ja._sfx_search("ドキドキ")
+
+        self.assertIsNone(result)
+        driver.quit.assert_called_once()
+        self.assertIsNone(self.ja._sfx_driver)
+
+    def test_render_timeout_keeps_driver(self):
+        from selenium.common.exceptions import TimeoutException
+
+        driver = MagicMock()
+        driver.page_source = "<html><body><main></main></body></html>"
+
+        with (
+            patch("selenium.webdriver.Chrome", return_value=driver),
+            patch("selenium.webdriver.support.ui.WebDriverWait") as wait,
+        ):
+            wait.return_value.until.side_effect = TimeoutException()
+            result = self.ja._sfx_search("ドキドキ")
+
+        self.assertIsNone(result)
+        driver.quit.assert_not_called()
+        self.assertIs(self.ja._sfx_driver, driver)
+
+
+class TestJaHepburn(unittest.TestCase):
+    """Table-based kana romanization should agree with pykakasi."""
+
+    def test_hiragana_matches_pykakasi(self):
+        import ziwen_lookup.ja as ja
+
+        for word in ("は", "きょう", "がっこう", "まっちゃ", "しゃしん", "きんえん", "こんや"):
+            expected = " ".join(item["hepburn"] for item in ja._kks.convert(word))
+            self.assertEqual(ja._hiragana_to_hepburn(word), expected)
+
+    def test_unsupported_spellings_fall_back(self):
+        import ziwen_lookup.ja as ja
+
+        self.assertIsNone(ja._hiragana_to_hepburn("あっ"))
+        self.assertIsNone(ja._hiragana_to_hepburn("ゃ"))
+        self.assertEqual(ja._to_hepburn("あっ"), "atsu")
+
+    def test_many_readings_share_one_conversion(self):
+        import ziwen_lookup.ja as ja
+
+        readings = ["おぼ.える", "カク", "さと.る", "カク"]
+        expected = [
+            " ".join(item["hepburn"] for item in ja._kks.convert(r)) for r in readings
+        ]
+        ja._hepburn_cache.clear()
+        with patch.object(ja, "_kks", wraps=ja._kks) as kks:
+            result = ja._to_hepburn_many(readings)
+
+        self.assertEqual(result, expected)
+        kks.convert.assert_called_once()
+
+    def test_ascii_is_returned_lowercased(self):
+        import ziwen_lookup.ja as ja
+
+        with patch.object(ja, "_kks") as kks:
+            self.assertEqual(ja._to_hepburn("Tamamine"), "tamamine")
+        kks.convert.assert_not_called()
+
+
+class TestJaParticleLookup(unittest.TestCase):
+    """Particle lookups should take their meanings from Jisho."""
+
+    def test_particle_meanings_come_from_jisho(self):
+        import ziwen_lookup.ja as ja
+        from lxml import html
+
+        page = html.fromstring(
+            '<span class="meaning-meaning">indicates direct object of action</span>'
+        )
+        with (
+            patch.object(ja, "get_from_cache", return_value=None),
+            patch.object(ja, "save_to_cache"),
+            patch.object(ja, "_get_client_session"),
+            patch.object(ja, "_fetch_page", return_value=page) as fetch_page,
+        ):
+            result = asyncio.run(ja._ja_character_fetch("を"))
+
+        self.assertIn("%23particle", fetch_page.call_args.args[1])
+        self.assertIn('"indicates direct object of action."', result)
+        self.assertIn("(*wo*)", result)
+
+
+class TestJaClientSession(unittest.TestCase):
+    """Lookups in one event loop should share a single aiohttp session."""
+
+    def test_session_is_reused_until_closed(self):
+        import ziwen_lookup.ja as ja
+
+        async def scenario():
+            first = await ja._get_client_session()
+            second = await ja._get_client_session()
+            await ja.close_client_session()
+            return first, second
+
+        first, second = asyncio.run(scenario())
+
+        self.assertIs(first, second)
+        self.assertTrue(first.closed)
+        self.assertNotIn(first, ja._client_sessions.values())
+
+
+class TestJaMultiKanjiLookup(unittest.TestCase):
+    """Multi-kanji lookups should request every kanji page concurrently."""
+
+    def test_pages_are_fetched_together_and_tabulated_in_order(self):
+        import ziwen_lookup.ja as ja
+        from lxml import html
+
+        in_flight = []
+        peak = []
+
+        async def fake_fetch_page(_session, url):
+            in_flight.append(url)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(url)
+            kanji = url.rsplit("/", 1)[1][0]
+            return html.fromstring(
+                '<div class="kanji-details__main-meanings">'
+                f"meaning of {kanji}</div>"
+            )
+
+        with (
+            patch.object(ja, "get_from_cache", return_value=None),
+            patch.object(ja, "save_to_cache"),
+            patch.object(ja, "_get_client_session"),
+            patch.object(ja, "_fetch_page", new=fake_fetch_page),
+        ):
+            result = asyncio.run(ja._ja_character_fetch("覚暁"))
+
+        self.assertEqual(max(peak), 2)
+        self.assertLess(result.index("[覚]"), result.index("[暁]"))
+        self.assertIn('"meaning of 暁."', result)
+
+
+class TestJaYojijukugo(unittest.TestCase):
+    """The yojijukugo supplement should only read the labelled rows it uses."""
+
+    def test_entry_rows_are_read_by_label(self):
+        import ziwen_lookup.ja as ja
+        from lxml import html
+
+        contain_page = html.fromstring(
+            '<a href="/yojia/271.html">一期一会（いちごいちえ）</a>'
+        )
+        entry_page = html.fromstring(
+            "<table>"
+            "<tr><th>四字熟語</th><td>一期一会</td></tr>"
+            "<tr><th>読み方</th><td>いちごいちえ</td></tr>"
+            "<tr><th>意味</th><td>一生に一度だけの機会。※注</td></tr>"
+            "<tr><th>漢字詳細</th><td>unused</td></tr>"
+            "<tr><th>出典</th><td>『茶湯一会集』</td></tr>"
+            "</table>"
+        )
+        response = MagicMock()
+        response.url = "https://yoji.jitenon.jp/yojia/271.html"
+        session = MagicMock()
+        session.get.return_value.__aenter__.return_value = response
+
+        async def fake_fetch_page(_session, _url):
+            return contain_page
+
+        async def fake_parse_response(_response):
+            return entry_page
+
+        with (
+            patch.object(ja, "_fetch_page", new=fake_fetch_page),
+            patch.object(ja, "_parse_response", new=fake_parse_response),
+            patch.object(ja, "_to_hepburn", return_value="ichigoichie"),
+        ):
+            result = asyncio.run(ja._ja_word_yojijukugo(session, "一期一会"))
+
+        self.assertIn("一生に一度だけの機会。", result)
+        self.assertNotIn("※注", result)
+        self.assertNotIn("unused", result)
+        self.assertIn("『茶湯一会集』", result)
+
+
 class TestCjkLookupNormalization(unittest.TestCase):
     """Compatibility ideographs should normalize before cache/fetch lookup."""
 
@@ -525,6 +923,250 @@ class TestCjkLookupNormalization(unittest.TestCase):
         fetch.assert_called_once_with("晴")
 
 
+class TestKoWordAsync(unittest.TestCase):
+    """The async Korean lookup should mirror ko_word's cache handling."""
+
+    def test_cache_miss_fetches_word(self):
+        import ziwen_lookup.ko as ko
+
+        with (
+            patch("ziwen_lookup.ko.get_from_cache", return_value=None) as cache,
+            patch("ziwen_lookup.ko._ko_word_fetch", return_value="ok") as fetch,
+        ):
+            result = asyncio.run(ko.ko_word_async(" 투쟁 "))
+
+        self.assertEqual(result, "ok")
+        cache.assert_called_once_with("투쟁", "ko", "ko_word")
+        fetch.assert_called_once_with("투쟁")
+
+    def test_bulk_lookup_runs_words_together(self):
+        import ziwen_lookup.ko as ko
+
+        in_flight = []
+        peak = []
+
+        async def fake_ko_word_async(word):
+            in_flight.append(word)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(word)
+            return None if word == "없다" else f"result for {word}"
+
+        with (
+            patch.object(ko, "ko_word_async", new=fake_ko_word_async),
+            patch.object(ko, "KRDICT_REQUEST_INTERVAL", 0),
+        ):
+            result = asyncio.run(ko.ko_words_bulk([" 투쟁", "깃발", "없다", "투쟁"]))
+
+        self.assertEqual(max(peak), 3)
+        self.assertEqual(
+            result,
+            {"투쟁": "result for 투쟁", "깃발": "result for 깃발", "없다": None},
+        )
+
+    def test_bulk_lookup_limits_concurrent_requests(self):
+        import ziwen_lookup.ko as ko
+
+        in_flight = []
+        peak = []
+
+        async def fake_ko_word_async(word):
+            in_flight.append(word)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(word)
+            return f"result for {word}"
+
+        words = [f"단어{index}" for index in range(10)]
+        with (
+            patch.object(ko, "ko_word_async", new=fake_ko_word_async),
+            patch.object(ko, "KRDICT_REQUEST_INTERVAL", 0),
+        ):
+            result = asyncio.run(ko.ko_words_bulk(words))
+
+        self.assertEqual(max(peak), ko.KRDICT_MAX_CONCURRENT)
+        self.assertEqual(list(result), words)
+
+    def test_bulk_lookup_spaces_out_request_starts(self):
+        import ziwen_lookup.ko as ko
+
+        interval = 0.05
+        started = []
+        in_flight = []
+        peak = []
+
+        async def fake_ko_word_async(word):
+            started.append(asyncio.get_running_loop().time())
+            in_flight.append(word)
+            peak.append(len(in_flight))
+            await asyncio.sleep(interval * 3)
+            in_flight.remove(word)
+            return f"result for {word}"
+
+        with (
+            patch.object(ko, "ko_word_async", new=fake_ko_word_async),
+            patch.object(ko, "KRDICT_REQUEST_INTERVAL", interval),
+        ):
+            asyncio.run(ko.ko_words_bulk(["투쟁", "깃발", "없다"]))
+
+        gaps = [later - earlier for earlier, later in zip(started, started[1:])]
+        self.assertTrue(all(gap >= interval * 0.9 for gap in gaps), gaps)
+        self.assertEqual(max(peak), 3)
+
+
+class TestKoWordFetch(unittest.TestCase):
+    """Korean entries should render their English glosses by part of speech."""
+
+    def test_english_glosses_are_grouped_with_origin(self):
+        import ziwen_lookup.ko as ko
+
+        raw = {
+            "Noun": [
+                {
+                    "word": "투쟁",
+                    "origin": "鬪爭",
+                    "part_of_speech": "명사",
+                    "english_definitions": ["fight", "struggle"],
+                }
+            ]
+        }
+        with (
+            patch("ziwen_lookup.ko._ko_search_raw", return_value=raw),
+            patch("ziwen_lookup.ko.save_to_cache"),
+        ):
+            result = ko._ko_word_fetch("투쟁")
+
+        self.assertIn("##### *Noun*", result)
+        self.assertIn("* [鬪爭](https://en.wiktionary.org/wiki/鬪爭): fight", result)
+        self.assertIn("* [鬪爭](https://en.wiktionary.org/wiki/鬪爭): struggle", result)
+
+
+class TestKoKrdictKey(unittest.TestCase):
+    """The KRDict key should be registered on first search, not on import."""
+
+    def test_key_is_set_once_on_first_search(self):
+        import ziwen_lookup.ko as ko
+
+        empty_response = MagicMock()
+        empty_response.data.results = []
+        with (
+            patch.object(ko, "_krdict_key_set", False),
+            patch.object(ko, "_search_cache", OrderedDict()),
+            patch.object(
+                ko, "load_settings", return_value={"KRDICT_API_KEY": "k"}
+            ) as mock_load,
+            patch.object(ko.krdict, "set_key") as mock_set_key,
+            patch.object(ko.krdict, "search", return_value=empty_response),
+        ):
+            ko._ko_search_raw("투쟁")
+            ko._ko_search_raw("사랑")
+
+        mock_load.assert_called_once()
+        mock_set_key.assert_called_once_with("k")
+
+
+class TestKoSearchCache(unittest.TestCase):
+    """Repeat KRDict searches should be answered from memory."""
+
+    def setUp(self):
+        import ziwen_lookup.ko as ko
+
+        self.ko = ko
+        self.patches = [
+            patch.object(ko, "_search_cache", OrderedDict()),
+            patch.object(ko, "_krdict_key_set", True),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+
+    def test_repeat_search_skips_the_api(self):
+        response = MagicMock()
+        response.data.results = []
+        with patch.object(
+            self.ko.krdict, "search", return_value=response
+        ) as mock_search:
+            first = self.ko._ko_search_raw("투쟁")
+            second = self.ko._ko_search_raw(" 투쟁 ")
+
+        mock_search.assert_called_once()
+        self.assertIs(first, second)
+
+    def test_failed_search_is_not_cached(self):
+        response = MagicMock()
+        response.data.results = []
+        with patch.object(
+            self.ko.krdict,
+            "search",
+            side_effect=[RuntimeError("down")] * 3 + [response],
+        ) as mock_search:
+            self.assertEqual(self.ko._ko_search_raw("투쟁"), {})
+            self.ko._ko_search_raw("투쟁")
+
+        self.assertEqual(mock_search.call_count, 4)
+
+
+class TestKoSearchRawGrouping(unittest.TestCase):
+    """KRDict entries should come back grouped by English part of speech."""
+
+    @staticmethod
+    def _entry(word, pos, glosses):
+        translations = [
+            types.SimpleNamespace(language="영어", definition=gloss) for gloss in glosses
+        ]
+        translations.append(types.SimpleNamespace(language="일본어", definition="x"))
+        return types.SimpleNamespace(
+            word=word,
+            origin=None,
+            part_of_speech=pos,
+            definitions=[types.SimpleNamespace(definition="...", translations=translations)],
+        )
+
+    def test_entries_grouped_in_result_order(self):
+        import ziwen_lookup.ko as ko
+
+        response = MagicMock()
+        response.data.results = [
+            self._entry("불길", "명사", ["flame"]),
+            self._entry("불길하다", "형용사", ["ominous"]),
+            self._entry("불길", "부사", ["fiercely"]),
+            self._entry("불길", "명사", ["ill omen"]),
+        ]
+        with (
+            patch.object(ko, "_search_cache", OrderedDict()),
+            patch.object(ko, "_krdict_key_set", True),
+            patch.object(ko.krdict, "search", return_value=response),
+        ):
+            data = ko._ko_search_raw("불길")
+
+        self.assertEqual(list(data), ["Noun", "Adverb"])
+        self.assertEqual(
+            [e["english_definitions"] for e in data["Noun"]],
+            [["flame"], ["ill omen"]],
+        )
+
+    def test_entries_without_english_glosses_are_dropped(self):
+        import ziwen_lookup.ko as ko
+
+        response = MagicMock()
+        response.data.results = [
+            self._entry("불길", "명사", ["flame"]),
+            self._entry("불길", "부사", []),
+        ]
+        with (
+            patch.object(ko, "_search_cache", OrderedDict()),
+            patch.object(ko, "_krdict_key_set", True),
+            patch.object(ko.krdict, "search", return_value=response),
+        ):
+            data = ko._ko_search_raw("불길")
+
+        self.assertEqual(list(data), ["Noun"])
+        self.assertEqual(data["Noun"][0]["english_definitions"], ["flame"])
+
+
 # ---------------------------------------------------------------------------
 # TestKoTokenizer
 # ---------------------------------------------------------------------------
@@ -591,6 +1233,57 @@ class TestKoTokenizer(unittest.TestCase):
         for token in result:
             self.assertRegex(token, r"[\uac00-\ud7af]+")
 
+    def test_ko_kiwi_is_loaded_once(self):
+        """The Kiwi model is shared across calls rather than reloaded."""
+        import ziwen_lookup.match_helpers as match_helpers
+
+        kiwi = MagicMock()
+        kiwi.tokenize.side_effect = lambda phrases, **kwargs: [
+            [
+                types.SimpleNamespace(form="투쟁", tag="NNG"),
+                types.SimpleNamespace(form="의", tag="JKG"),
+            ]
+            for _ in phrases
+        ]
+        with (
+            patch.object(match_helpers, "_kiwi", None),
+            patch.object(match_helpers, "_ko_token_cache", OrderedDict()),
+            patch.object(match_helpers, "Kiwi", return_value=kiwi) as kiwi_cls,
+        ):
+            first = lookup_ko_tokenizer("투쟁의")
+            second = lookup_ko_tokenizer("투쟁의")
+            third = lookup_ko_tokenizer("투쟁")
+            first.append("mutated")  # callers get their own list
+            fourth = lookup_ko_tokenizer("투쟁의")
+
+        kiwi_cls.assert_called_once()
+        # The repeated phrase is answered from memory without re-analysis.
+        self.assertEqual(kiwi.tokenize.call_count, 2)
+        self.assertEqual(second, ["투쟁"])
+        self.assertEqual(third, ["투쟁"])
+        self.assertEqual(fourth, ["투쟁"])
+
+    def test_ko_batch_analyzes_uncached_runs_together(self):
+        """Several Hangul runs cost one Kiwi call, skipping known phrases."""
+        import ziwen_lookup.match_helpers as match_helpers
+
+        kiwi = MagicMock()
+        kiwi.tokenize.side_effect = lambda phrases, **kwargs: [
+            [types.SimpleNamespace(form=phrase, tag="NNG")] for phrase in phrases
+        ]
+        with (
+            patch.object(match_helpers, "_kiwi", kiwi),
+            patch.object(match_helpers, "_ko_token_cache", OrderedDict()),
+        ):
+            lookup_ko_tokenizer("깃발")
+            result = match_helpers.lookup_ko_tokenizer_batch(
+                ["투쟁", "깃발", "외침", "투쟁"]
+            )
+
+        self.assertEqual(result, [["투쟁"], ["깃발"], ["외침"], ["투쟁"]])
+        self.assertEqual(kiwi.tokenize.call_count, 2)
+        self.assertEqual(kiwi.tokenize.call_args.args[0], ["투쟁", "외침"])
+
 
 # ---------------------------------------------------------------------------
 # TestLookupMatcher
@@ -666,6 +1359,51 @@ class TestLookupMatcher(unittest.TestCase):
         result = lookup_matcher("`热血`", None)
         self.assertIn("zh", result)
 
+    def test_script_detection_flags(self):
+        """Kana counts as Hanzi too, matching the broad CJK range."""
+        from ziwen_lookup.match_helpers import _detect_scripts
+
+        self.assertEqual(_detect_scripts("热血"), (True, False, False))
+        self.assertEqual(_detect_scripts("いざ"), (True, True, False))
+        self.assertEqual(_detect_scripts("食べる"), (True, True, False))
+        self.assertEqual(_detect_scripts("투쟁 斗争"), (True, False, True))
+        self.assertEqual(_detect_scripts("hello"), (False, False, False))
+
+    def test_zh_runs_segmented_in_one_jieba_pass(self):
+        """All Hanzi runs in a comment share one Jieba call."""
+        import ziwen_lookup.match_helpers as match_helpers
+
+        with patch.object(
+            match_helpers.jieba, "cut", wraps=match_helpers.jieba.cut
+        ) as cut:
+            result = lookup_matcher("`最后的斗争` and `團結起來`, `斗争`", "zh")
+
+        cut.assert_called_once()
+        self.assertEqual(
+            result["zh"],
+            [
+                ("最后", False),
+                ("的", False),
+                ("斗争", False),
+                ("團結起來", False),
+                ("斗争", False),
+            ],
+        )
+
+    def test_tokenizers_skipped_for_unrequested_languages(self):
+        """Segments are not tokenized for languages they won't be stored under."""
+        with (
+            patch("ziwen_lookup.match_helpers.lookup_ko_tokenizer_batch") as ko_tokenizer,
+            patch("ziwen_lookup.match_helpers.lookup_zh_ja_tokenizer") as zh_ja_tokenizer,
+        ):
+            hangul_result = lookup_matcher("`투쟁`", "zh")
+            hanzi_result = lookup_matcher("`斗争`", "ko")
+
+        ko_tokenizer.assert_not_called()
+        zh_ja_tokenizer.assert_not_called()
+        self.assertEqual(hangul_result, {})
+        self.assertEqual(hanzi_result, {})
+
     # --- !identify / !id command ---
 
     @_skip_on_error
@@ -688,6 +1426,85 @@ class TestLookupMatcher(unittest.TestCase):
         result = lookup_matcher("`투쟁` !id:ko", language_code=None)
         self.assertIn("ko", result)
 
+    @_skip_on_error
+    def test_identify_command_dialect_maps_to_zh(self):
+        """`斗争` !identify:yue stores Cantonese lookups under zh."""
+        result = lookup_matcher("`斗争` !identify:yue", language_code=None)
+        self.assertIn("zh", result)
+        self.assertNotIn("yue", result)
+
+    def test_cjk_code_map_flattens_settings(self):
+        """Every listed code maps to its 2-letter CJK code, case-insensitively."""
+        from ziwen_lookup.match_helpers import _build_cjk_code_map
+
+        code_map = _build_cjk_code_map(
+            {
+                "CJK_LANGUAGES": {
+                    "Chinese": ["zh", "YUE"],
+                    "Japanese": ["ja", "ryu"],
+                    "Korean": ["ko"],
+                    "Other": ["xx"],
+                    "Notes": "not a list",
+                }
+            }
+        )
+        self.assertEqual(
+            code_map, {"zh": "zh", "yue": "zh", "ja": "ja", "ryu": "ja", "ko": "ko"}
+        )
+
+    def test_language_settings_are_read_once(self):
+        """The settings file is not re-read for every comment."""
+        import ziwen_lookup.match_helpers as match_helpers
+
+        settings = {"CJK_LANGUAGES": {"Chinese": ["zh", "yue"]}}
+        with (
+            patch.object(match_helpers, "_cjk_code_map_cache", None),
+            patch.object(
+                match_helpers, "load_settings", return_value=settings
+            ) as mock_load,
+        ):
+            first = match_helpers.get_cjk_code_map()
+            second = match_helpers.get_cjk_code_map()
+            refreshed = match_helpers.get_cjk_code_map(force_refresh=True)
+
+        self.assertIs(first, second)
+        self.assertEqual(refreshed, {"zh": "zh", "yue": "zh"})
+        self.assertEqual(mock_load.call_count, 2)
+
+    def test_refresh_clears_resolved_language_codes(self):
+        """Reloading the settings also forgets memoized code resolutions."""
+        import ziwen_lookup.match_helpers as match_helpers
+
+        first_lingvo, second_lingvo = MagicMock(), MagicMock()
+        first_lingvo.preferred_code = "zh"
+        second_lingvo.preferred_code = "yue"
+        match_helpers._resolve_language_code.cache_clear()
+        with (
+            patch.object(match_helpers, "_cjk_code_map_cache", None),
+            patch.object(match_helpers, "load_settings", return_value={}),
+            patch.object(
+                match_helpers, "converter", side_effect=[first_lingvo, second_lingvo]
+            ),
+        ):
+            before = match_helpers._resolve_language_code("cantonese")
+            match_helpers.get_cjk_code_map(force_refresh=True)
+            after = match_helpers._resolve_language_code("cantonese")
+        match_helpers._resolve_language_code.cache_clear()
+
+        self.assertEqual((before, after), ("zh", "yue"))
+
+    def test_comment_without_backticks_returns_early(self):
+        """Comments with no backtick skip language resolution entirely."""
+        with (
+            patch("ziwen_lookup.match_helpers.get_cjk_code_map") as code_map,
+            patch("ziwen_lookup.match_helpers.extract_lingvos_from_text") as mentions,
+        ):
+            result = lookup_matcher("斗争 is a Chinese word !identify:zh", None)
+
+        self.assertEqual(result, {})
+        code_map.assert_not_called()
+        mentions.assert_not_called()
+
     # --- Inline language spec ---
 
     @_skip_on_error
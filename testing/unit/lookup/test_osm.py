@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Tests for Nominatim request pooling, rate limiting and caching."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from ziwen_lookup import osm
+
+NOMINATIM_RESULT = {
+    "display_name": "Chongqing, China",
+    "osm_type": "relation",
+    "osm_id": 913069,
+    "category": "boundary",
+    "type": "administrative",
+    "lat": "29.5585712",
+    "lon": "106.5492822",
+}
+
+
+class FakeClock:
+    """Stands in for time.monotonic and time.sleep, so no test really waits."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Reset the cache and rate limiter around each test and fake the clock."""
+
+    fake_clock = FakeClock()
+    monkeypatch.setattr(osm.time, "monotonic", fake_clock.monotonic)
+    monkeypatch.setattr(osm.time, "sleep", fake_clock.sleep)
+    monkeypatch.setattr(osm, "_last_nominatim_request", 0.0)
+    osm._fetch_nominatim.cache_clear()
+    yield fake_clock
+    osm._fetch_nominatim.cache_clear()
+
+
+def _mock_response(results, status_code=200, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = results
+    response.raise_for_status = MagicMock()
+    return response
+
+
+def test_session_keeps_connections_and_leaves_retries_to_the_gate():
+    """Nominatim requests use a pooled session that does not retry on its own."""
+
+    adapter = osm._session.get_adapter("https://nominatim.openstreetmap.org/")
+
+    assert adapter._pool_maxsize == 8
+    assert adapter.max_retries.total == 0
+    assert osm._session.headers["User-Agent"] == "Python OSM Search Script"
+
+
+def test_repeated_query_is_served_from_cache(monkeypatch, clock):
+    """Searching the same place twice sends only one request to Nominatim."""
+
+    get_mock = MagicMock(return_value=_mock_response([NOMINATIM_RESULT]))
+    monkeypatch.setattr(osm._session, "get", get_mock)
+
+    first = osm.search_nominatim("Chongqing")
+    second = osm.search_nominatim("Chongqing")
+
+    assert first == second
+    assert "[Chongqing, China]" in first[0]
+    get_mock.assert_called_once()
+    assert "q=Chongqing" in get_mock.call_args.args[0]
+
+
+def test_failed_request_is_not_cached(monkeypatch, clock):
+    """A failed request is retried on the next search rather than remembered."""
+
+    failing = _mock_response([], status_code=404)
+    failing.raise_for_status.side_effect = requests.HTTPError("404")
+    get_mock = MagicMock(
+        side_effect=[failing, _mock_response([NOMINATIM_RESULT])]
+    )
+    monkeypatch.setattr(osm._session, "get", get_mock)
+
+    assert osm.search_nominatim("Chongqing") == []
+    assert len(osm.search_nominatim("Chongqing")) == 1
+    assert get_mock.call_count == 2
+
+
+def test_consecutive_requests_are_spaced_by_rate_limit(monkeypatch, clock):
+    """A second request within the interval waits out the rest of it."""
+
+    request_times = []
+
+    def fake_get(url, timeout):
+        request_times.append(clock.now)
+        clock.now += 0.25
+        return _mock_response([])
+
+    monkeypatch.setattr(osm._session, "get", fake_get)
+
+    osm._fetch_nominatim("Chongqing", "en-US,en")
+    osm._fetch_nominatim("Chengdu", "en-US,en")
+
+    assert clock.sleeps == [pytest.approx(osm.NOMINATIM_MIN_INTERVAL - 0.25)]
+    assert request_times[1] - request_times[0] == pytest.approx(
+        osm.NOMINATIM_MIN_INTERVAL
+    )
+
+
+def test_request_after_interval_does_not_wait(monkeypatch, clock):
+    """No delay is added once the interval has already passed."""
+
+    monkeypatch.setattr(osm._session, "get", MagicMock(return_value=_mock_response([])))
+
+    osm._fetch_nominatim("Chongqing", "en-US,en")
+    clock.now += osm.NOMINATIM_MIN_INTERVAL
+    osm._fetch_nominatim("Chengdu", "en-US,en")
+
+    assert clock.sleeps == []
+
+
+def test_retries_wait_for_the_rate_limit_and_retry_after(monkeypatch, clock):
+    """Retried requests go through the gate and honour Retry-After."""
+
+    request_times = []
+    responses = [
+        _mock_response([], status_code=429, headers={"Retry-After": "3"}),
+        _mock_response([], status_code=503),
+        _mock_response([NOMINATIM_RESULT]),
+    ]
+
+    def fake_get(url, timeout):
+        request_times.append(clock.now)
+        return responses.pop(0)
+
+    monkeypatch.setattr(osm._session, "get", fake_get)
+
+    assert osm._fetch_nominatim("Chongqing", "en-US,en") == (NOMINATIM_RESULT,)
+    assert request_times[1] - request_times[0] == pytest.approx(3)
+    assert request_times[2] - request_times[1] == pytest.approx(
+        osm.NOMINATIM_MIN_INTERVAL
+    )
+
+
+def test_persistent_errors_stop_after_the_retry_limit(monkeypatch, clock):
+    """A server that keeps failing is tried NOMINATIM_RETRIES more times."""
+
+    failing = _mock_response([], status_code=503)
+    failing.raise_for_status.side_effect = requests.HTTPError("503")
+    get_mock = MagicMock(return_value=failing)
+    monkeypatch.setattr(osm._session, "get", get_mock)
+
+    assert osm.search_nominatim("Chongqing") == []
+    assert get_mock.call_count == osm.NOMINATIM_RETRIES + 1
+
+
+def test_wait_happens_outside_the_lock(monkeypatch, clock):
+    """Callers waiting for a slot do not hold the rate limiter's lock."""
+
+    lock_held_while_sleeping = []
+    real_sleep = clock.sleep
+
+    def sleep(seconds):
+        lock_held_while_sleeping.append(osm._nominatim_lock.locked())
+        real_sleep(seconds)
+
+    monkeypatch.setattr(osm.time, "sleep", sleep)
+
+    osm._wait_for_nominatim_slot()
+    osm._wait_for_nominatim_slot()
+
+    assert lock_held_while_sleeping == [False]
@@ -32,8 +32,8 @@ def test_language_reference_treats_wikipedia_json_decode_as_missing_link(
         reference.Paths, "STATES", {"LANGUAGE_DATA": language_data_path}
     )
     monkeypatch.setattr(reference, "get_lingvos", MagicMock(return_value={"abc": lingvo}))
-    monkeypatch.setattr(reference, "get_random_useragent", MagicMock(return_value={}))
-    monkeypatch.setattr(reference.requests, "get", MagicMock(return_value=ethnologue_response))
+    get_mock = MagicMock(return_value=ethnologue_response)
+    monkeypatch.setattr(reference._session, "get", get_mock)
     monkeypatch.setattr(reference, "converter", MagicMock(return_value=lingvo))
     page_url_mock = MagicMock(return_value=None)
     monkeypatch.setattr(reference, "wikipedia_page_url", page_url_mock)
@@ -46,4 +46,50 @@ def test_language_reference_treats_wikipedia_json_decode_as_missing_link(
     assert result is not None
     assert result["language_code_3"] == "abc"
     assert result["link_wikipedia"] == ""
+    assert result["name_alternates"] == ["Example Alt"]
+    assert result["country"] == "Exampleland"
+    assert result["family"] == "Example family"
     page_url_mock.assert_called_once_with("ISO 639:abc")
+    assert "User-Agent" in get_mock.call_args.kwargs["headers"]
+
+
+def test_language_reference_reads_nested_fields_in_page_order(monkeypatch, tmp_path):
+    """Field divs nested in one another are read once each, in page order."""
+
+    language_data_path = tmp_path / "language_data.yaml"
+    language_data_path.write_text("abc: {}\n", encoding="utf-8")
+
+    ethnologue_response = MagicMock()
+    ethnologue_response.content = b"""
+        <div class="view-display-id-page"><div>exists</div></div>
+        <div class="alternate-names">
+            <div><div class="alternate-names"><div></div><div><div>Inner Alt</div></div></div></div>
+            <div><div>Outer Alt</div></div>
+        </div>
+        <div class="field-name-language-classification-link">
+            <div class="field-name-language-classification-link"><a>Example family</a></div>
+        </div>
+    """
+    ethnologue_response.raise_for_status = MagicMock()
+
+    lingvo = MagicMock()
+    lingvo.name = "Example"
+
+    monkeypatch.setattr(
+        reference.Paths, "STATES", {"LANGUAGE_DATA": language_data_path}
+    )
+    monkeypatch.setattr(reference, "get_lingvos", MagicMock(return_value={"abc": lingvo}))
+    monkeypatch.setattr(reference._session, "get", MagicMock(return_value=ethnologue_response))
+    monkeypatch.setattr(reference, "converter", MagicMock(return_value=lingvo))
+    monkeypatch.setattr(reference, "wikipedia_page_url", MagicMock(return_value=None))
+
+    result = reference._fetch_language_reference_data(
+        "https://web.archive.org/web/20190606120000/https://www.ethnologue.com/language/abc",
+        "abc",
+    )
+
+    assert result["name_alternates"] == ["Inner Alt"]
+    assert result["family"] == "Example family"
+    assert reference._XP_FAMILY(
+        reference.html.fromstring(ethnologue_response.content)
+    ) == ["Example family"]
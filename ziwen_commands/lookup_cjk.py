@@ -21,8 +21,8 @@ from models.komando import Komando
 from models.kunulo import Kunulo
 from reddit.reddit_sender import reddit_edit, reddit_reply
 from responses import RESPONSE
-from ziwen_lookup.ja import ja_character, ja_word
-from ziwen_lookup.ko import ko_word
+from ziwen_lookup.ja import close_client_session, ja_character_async, ja_word
+from ziwen_lookup.ko import ko_words_bulk
 from ziwen_lookup.zh import zh_character, zh_word
 
 logger = logging.LoggerAdapter(_base_logger, {"tag": "ZW:CJK"})
@@ -68,15 +68,10 @@ async def _lookup_chinese_term(term: str) -> str | None:
 async def _lookup_japanese_term(term: str) -> str | None:
     """Perform Japanese character or word lookup."""
     if len(term) == 1:
-        return await asyncio.to_thread(ja_character, term)
+        return await ja_character_async(term)
     return await ja_word(term)
 
 
-async def _lookup_korean_term(term: str) -> str | None:
-    """Perform Korean word lookup."""
-    return await asyncio.to_thread(ko_word, term)  # Run sync function in thread pool
-
-
 async def _rate_limit_delay() -> None:
     """Add randomized delay between lookup requests."""
     await asyncio.sleep(random.randint(3, 10))
@@ -85,10 +80,19 @@ async def _rate_limit_delay() -> None:
 async def perform_cjk_lookups(cjk_language: str, search_terms: list[str]) -> list[str]:
     """Perform lookups based on CJK language type.
     search_terms must be a list of strings."""
+    if cjk_language == "Korean":
+        # KRDict is a keyed API rather than a scraped site, so Korean
+        # lookups overlap; ko_words_bulk spaces out their start times
+        # instead of the longer randomized delay used below.
+        logger.info(f"Passing {search_terms} to the Korean lookup function...")
+        korean_results = await ko_words_bulk(search_terms)
+        return [
+            result for term in search_terms if (result := korean_results[term.strip()])
+        ]
+
     lookup_functions = {
         "Chinese": _lookup_chinese_term,
         "Japanese": _lookup_japanese_term,
-        "Korean": _lookup_korean_term,
     }
 
     lookup_func = lookup_functions.get(cjk_language)
@@ -97,11 +101,15 @@ async def perform_cjk_lookups(cjk_language: str, search_terms: list[str]) -> lis
 
     results: list[str] = []
     logger.info(f"Passing {search_terms} to the {cjk_language} lookup function...")
-    for term in search_terms:
-        result = await lookup_func(term)
-        if result:
-            results.append(result)
-        await _rate_limit_delay()
+    try:
+        for term in search_terms:
+            result = await lookup_func(term)
+            if result:
+                results.append(result)
+            await _rate_limit_delay()
+    finally:
+        # Japanese lookups share one HTTP session per event loop.
+        await close_client_session()
 
     return results
 
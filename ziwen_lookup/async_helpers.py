@@ -54,7 +54,8 @@ async def call_sync_async(func: Callable, *args: Any, **kwargs: Any) -> Any:
     Execute a function that may be synchronous or asynchronous.
 
     If the function is a coroutine, it is awaited directly.
-    Otherwise, it runs in a thread executor to avoid blocking the event loop.
+    Otherwise, it runs in the running loop's default thread executor via
+    asyncio.to_thread to avoid blocking the event loop.
 
     Args:
         func (Callable): The function to execute. Can be async or sync.
@@ -66,5 +67,4 @@ async def call_sync_async(func: Callable, *args: Any, **kwargs: Any) -> Any:
     """
     if inspect.iscoroutinefunction(func):
         return await func(*args, **kwargs)
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, func, *args)
+    return await asyncio.to_thread(func, *args, **kwargs)
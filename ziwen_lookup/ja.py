@@ -7,20 +7,21 @@ Contains functions that deal with Japanese-language content.
 Logger tag: [L:JA]
 """
 
+import asyncio
+import atexit
 import logging
 import re
-from time import sleep
-from typing import Any
+import threading
+from collections.abc import Awaitable
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import pykakasi
-import requests
-from lxml import html
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
+from lxml import etree, html
 
 from config import logger as _base_logger
-from integrations.http import DEFAULT_HTTP_TIMEOUT, get_random_useragent
+from integrations.http import get_random_useragent
 from ziwen_lookup.async_helpers import call_sync_async, fetch_json
 from ziwen_lookup.cache_helpers import (
     format_ja_character_from_cache,
@@ -33,20 +34,337 @@ from ziwen_lookup.cache_helpers import (
 from ziwen_lookup.normalization import normalize_lookup_key
 from ziwen_lookup.zh import calligraphy_search
 
+if TYPE_CHECKING:
+    from selenium import webdriver
+
 logger = logging.LoggerAdapter(_base_logger, {"tag": "L:JA"})
 
-useragent = get_random_useragent()
+# Chosen once per process and shared read-only by every request in this module.
+useragent: MappingProxyType[str, str] = MappingProxyType(get_random_useragent())
+
+_AIOHTTP_TIMEOUT = aiohttp.ClientTimeout(sock_connect=5, total=15)
+
+# Shared by every page parse. None of the lookups use the document's id map.
+_HTML_PARSER = html.HTMLParser(collect_ids=False)
+
+
+# aiohttp sessions are bound to the event loop that created them, and each
+# lookup command runs in its own loop, so one session is kept per loop. Code
+# that starts a loop with asyncio.run must await close_client_session() in a
+# finally block before the loop ends, as ja_character does.
+_client_sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+
+async def _get_client_session() -> aiohttp.ClientSession:
+    """
+    Return the shared aiohttp session for the running event loop, creating
+    it on first use. Lookups in the same loop reuse its keep-alive connections
+    and DNS cache; no more than four requests hit the same host at a time.
+    """
+    # A session whose loop has already closed can no longer be closed
+    # cleanly, so it is dropped and the missing close_client_session() call
+    # is logged.
+    for stale_loop in [loop for loop in _client_sessions if loop.is_closed()]:
+        if not _client_sessions.pop(stale_loop).closed:
+            logger.warning("aiohttp session left open by a closed event loop.")
+
+    loop = asyncio.get_running_loop()
+    session = _client_sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=10, limit_per_host=4, ttl_dns_cache=300)
+        session = aiohttp.ClientSession(
+            headers=useragent, timeout=_AIOHTTP_TIMEOUT, connector=connector
+        )
+        _client_sessions[loop] = session
+    return session
+
+
+async def close_client_session() -> None:
+    """Close the running event loop's shared session, if one was opened."""
+    session = _client_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+async def _parse_response(response: aiohttp.ClientResponse) -> Any:
+    """
+    Parse a response body into an lxml tree as it downloads, so parsing
+    overlaps the network transfer instead of waiting for the whole page.
+
+    :param response: An open response whose body has not been read yet.
+    :return: The parsed HTML tree.
+    """
+    # Each page gets its own feed parser, since pages are parsed concurrently.
+    # Without a charset header, lxml falls back to the page's declared one.
+    parser = html.HTMLParser(collect_ids=False, encoding=response.charset)
+    async for chunk in response.content.iter_chunked(8192):
+        parser.feed(chunk)
+    return parser.close()
+
+
+async def _fetch_page(session: aiohttp.ClientSession, url: str) -> Any:
+    """
+    Fetch a page and parse it into an lxml tree.
+
+    :param session: An active aiohttp session used for the request.
+    :param url: The page to fetch.
+    :return: The parsed HTML tree. HTTP errors are raised to the caller.
+    """
+    async with session.get(url) as response:
+        response.raise_for_status()
+        return await _parse_response(response)
+
+
+# ─── XPath queries ────────────────────────────────────────────────────────────
+# Compiled once at import and reused for every parsed page. Variable input is
+# bound through XPath variables (e.g. $word) rather than interpolated.
+
+# Jisho kanji and particle pages
+_XP_KUN_READINGS = etree.XPath(
+    '//div[contains(@class,"kanji-details__main-readings")]/dl[1]/dd/a/text()'
+)
+_XP_ON_READINGS = etree.XPath(
+    '//div[contains(@class,"kanji-details__main-readings")]/dl[2]/dd/a/text()'
+)
+_XP_ON_READINGS_FALLBACK = etree.XPath(
+    '//*[@id="result_area"]/div/div[1]/div[2]/div/div[1]/div[2]/dl/dd/a/text()'
+)
+_XP_KANJI_MEANINGS = etree.XPath(
+    '//div[contains(@class,"kanji-details__main-meanings")]/text()'
+)
+_XP_PARTICLE_MEANINGS = etree.XPath('//span[contains(@class,"meaning-meaning")]/text()')
+
+# nsk.sh onomatopoeia pages; all but the first are relative to the result container
+_XP_SFX_CONTAINER = etree.XPath("//main/div/div/div[1]/div")
+_XP_SFX_HEADING = etree.XPath(".//h3[1]")
+_XP_SFX_LIST = etree.XPath(".//ul[1]")
+_XP_SFX_MATCH_TEXT = etree.XPath("./div/div[1]/h3/text()")
+_XP_SFX_LIST_ITEMS = etree.XPath("./li")
+
+# kanji.reader.bz name pages
+_XP_NAME_KANJI = etree.XPath('//div[contains(@id,"main")]/p[1]/text()')
+_XP_NAME_HIRAGANA = etree.XPath('//div[contains(@id,"main")]/p[1]/a/text()')
+
+# yoji.jitenon.jp entry pages
+_XP_YOJI_ENTRY_LINKS = etree.XPath(
+    "//a[starts-with(normalize-space(text()), $word)]/@href"
+)
+# Only the rows whose label is read below, so the rest of the table (kanji
+# breakdowns, related idioms, usage notes) is never materialized as text.
+_XP_YOJI_ROWS = etree.XPath(
+    "//table//tr[td][th[normalize-space()='四字熟語' or normalize-space()='読み方'"
+    " or normalize-space()='意味' or normalize-space()='出典']]"
+)
+
+
+# ─── Script detection ─────────────────────────────────────────────────────────
+
+_HIRAGANA_RE: re.Pattern[str] = re.compile(r"[\u3040-\u309f]")
+_KATAKANA_RE: re.Pattern[str] = re.compile(r"[\u30a0-\u30ff]")
 
 
 # ─── Romanization helper ──────────────────────────────────────────────────────
 
 _kks = pykakasi.kakasi()
 
+# Plain hiragana (readings, particles) is romanized from a lookup table;
+# anything else goes through pykakasi's full segmentation pipeline.
+_HIRAGANA_ONLY_RE: re.Pattern[str] = re.compile(r"[\u3041-\u3096]+")
+_HIRAGANA_ROMAJI: dict[str, str] = {
+    "あ": "a",
+    "い": "i",
+    "う": "u",
+    "え": "e",
+    "お": "o",
+    "か": "ka",
+    "き": "ki",
+    "く": "ku",
+    "け": "ke",
+    "こ": "ko",
+    "さ": "sa",
+    "し": "shi",
+    "す": "su",
+    "せ": "se",
+    "そ": "so",
+    "た": "ta",
+    "ち": "chi",
+    "つ": "tsu",
+    "て": "te",
+    "と": "to",
+    "な": "na",
+    "に": "ni",
+    "ぬ": "nu",
+    "ね": "ne",
+    "の": "no",
+    "は": "ha",
+    "ひ": "hi",
+    "ふ": "fu",
+    "へ": "he",
+    "ほ": "ho",
+    "ま": "ma",
+    "み": "mi",
+    "む": "mu",
+    "め": "me",
+    "も": "mo",
+    "や": "ya",
+    "ゆ": "yu",
+    "よ": "yo",
+    "ら": "ra",
+    "り": "ri",
+    "る": "ru",
+    "れ": "re",
+    "ろ": "ro",
+    "わ": "wa",
+    "を": "wo",
+    "ん": "n",
+    "が": "ga",
+    "ぎ": "gi",
+    "ぐ": "gu",
+    "げ": "ge",
+    "ご": "go",
+    "ざ": "za",
+    "じ": "ji",
+    "ず": "zu",
+    "ぜ": "ze",
+    "ぞ": "zo",
+    "だ": "da",
+    "ぢ": "ji",
+    "づ": "zu",
+    "で": "de",
+    "ど": "do",
+    "ば": "ba",
+    "び": "bi",
+    "ぶ": "bu",
+    "べ": "be",
+    "ぼ": "bo",
+    "ぱ": "pa",
+    "ぴ": "pi",
+    "ぷ": "pu",
+    "ぺ": "pe",
+    "ぽ": "po",
+    "ゔ": "vu",
+}
+_YOON_VOWELS: dict[str, str] = {"ゃ": "a", "ゅ": "u", "ょ": "o"}
+_SOKUON_CONSONANTS: frozenset[str] = frozenset("bcdfghjkprsty")
+
+
+def _hiragana_to_hepburn(input_text: str) -> str | None:
+    """
+    Romanize a plain hiragana string from the lookup table.
+
+    :param input_text: A string matching `_HIRAGANA_ONLY_RE`.
+    :return: The romanization, or None if the string uses a spelling
+             (standalone small kana, trailing っ) the table does not cover.
+    """
+    syllables: list[str] = []
+    for kana in input_text:
+        if kana in _YOON_VOWELS:
+            # Combine with a preceding i-row kana: き + ゃ -> kya, し + ゃ -> sha.
+            if not syllables or len(syllables[-1]) < 2 or syllables[-1][-1] != "i":
+                return None
+            stem = syllables[-1][:-1]
+            if stem not in ("sh", "ch", "j"):
+                stem += "y"
+            syllables[-1] = stem + _YOON_VOWELS[kana]
+        elif kana in _HIRAGANA_ROMAJI:
+            syllables.append(_HIRAGANA_ROMAJI[kana])
+        elif kana == "っ":
+            syllables.append("")
+        else:
+            return None
+
+    romaji: str = ""
+    for index, syllable in enumerate(syllables):
+        following = syllables[index + 1] if index + 1 < len(syllables) else ""
+        if syllable == "":
+            # Sokuon doubles the next consonant (ch is written as tch).
+            if not following or following[0] not in _SOKUON_CONSONANTS:
+                return None
+            romaji += "t" if following.startswith("ch") else following[0]
+        elif syllable == "n" and following[:1] in ("a", "i", "u", "e", "o"):
+            romaji += "n'"
+        else:
+            romaji += syllable
+    return romaji
+
+
+# Romanizations are memoized, since the same readings recur across lookups of
+# related kanji. The oldest entry is dropped once the cache is full.
+_HEPBURN_CACHE_SIZE = 4096
+_hepburn_cache: dict[str, str] = {}
+
+# pykakasi always emits the ideographic comma as a token of its own, so it
+# can separate several readings converted in a single pass.
+_HEPBURN_BATCH_SEPARATOR = "、"
+
+
+def _remember_hepburn(input_text: str, romaji: str) -> None:
+    """Store a romanization in the memo cache."""
+    if len(_hepburn_cache) >= _HEPBURN_CACHE_SIZE:
+        _hepburn_cache.pop(next(iter(_hepburn_cache)), None)
+    _hepburn_cache[input_text] = romaji
+
+
+def _quick_hepburn(input_text: str) -> str | None:
+    """Romanize ASCII or plain hiragana without pykakasi, or return None."""
+    if input_text.isascii():
+        return input_text.lower()
+    if _HIRAGANA_ONLY_RE.fullmatch(input_text):
+        return _hiragana_to_hepburn(input_text)
+    return None
+
 
 def _to_hepburn(input_text: str) -> str:
     """Returns a Hepburn romanization of the input."""
-    result = _kks.convert(input_text)
-    return " ".join([item["hepburn"] for item in result])
+    romaji = _hepburn_cache.get(input_text)
+    if romaji is None:
+        romaji = _quick_hepburn(input_text)
+        if romaji is None:
+            result = _kks.convert(input_text)
+            romaji = " ".join([item["hepburn"] for item in result])
+        _remember_hepburn(input_text, romaji)
+    return romaji
+
+
+def _to_hepburn_many(readings: list[str]) -> list[str]:
+    """
+    Romanize several readings, sending every uncached reading that needs
+    pykakasi through a single conversion pass.
+
+    :param readings: Kana readings, e.g. the kun or on readings of a kanji.
+    :return: The romanization of each reading, in the same order.
+    """
+    romanized: dict[str, str] = {}
+    batch: list[str] = []
+    for reading in dict.fromkeys(readings):
+        romaji = _hepburn_cache.get(reading) or _quick_hepburn(reading)
+        if romaji is not None:
+            romanized[reading] = romaji
+        elif _HEPBURN_BATCH_SEPARATOR in reading:
+            romanized[reading] = _to_hepburn(reading)
+        else:
+            batch.append(reading)
+
+    if batch:
+        groups: list[list[str]] = [[]]
+        for item in _kks.convert(_HEPBURN_BATCH_SEPARATOR.join(batch)):
+            if item["orig"] == _HEPBURN_BATCH_SEPARATOR:
+                groups.append([])
+            else:
+                groups[-1].append(item["hepburn"])
+
+        if len(groups) == len(batch):
+            for reading, group in zip(batch, groups, strict=True):
+                romanized[reading] = " ".join(group)
+        else:
+            # Unexpected segmentation; convert the readings one at a time.
+            for reading in batch:
+                romanized[reading] = _to_hepburn(reading)
+
+    for reading, romaji in romanized.items():
+        if reading not in _hepburn_cache:
+            _remember_hepburn(reading, romaji)
+    return [romanized[reading] for reading in readings]
 
 
 def _format_kun_on_readings(tree: Any) -> tuple[str, str]:
@@ -57,22 +375,23 @@ def _format_kun_on_readings(tree: Any) -> tuple[str, str]:
         kun_chunk (str): formatted kun readings, e.g. "よみ (*yomi*)"
         on_chunk (str): formatted on readings, e.g. "ヨミ (*yomi*)"
     """
-    kun_readings: list[str] = tree.xpath(
-        '//div[contains(@class,"kanji-details__main-readings")]/dl[1]/dd/a/text()'
-    )
+    kun_readings: list[str] = _XP_KUN_READINGS(tree)
 
     on_readings: list[str]
     if not kun_readings:
-        on_readings = tree.xpath(
-            '//*[@id="result_area"]/div/div[1]/div[2]/div/div[1]/div[2]/dl/dd/a/text()'
-        )
+        on_readings = _XP_ON_READINGS_FALLBACK(tree)
     else:
-        on_readings = tree.xpath(
-            '//div[contains(@class,"kanji-details__main-readings")]/dl[2]/dd/a/text()'
-        )
+        on_readings = _XP_ON_READINGS(tree)
+
+    romaji: list[str] = _to_hepburn_many(kun_readings + on_readings)
+    kun_romaji, on_romaji = romaji[: len(kun_readings)], romaji[len(kun_readings) :]
 
-    kun_chunk: str = ", ".join(f"{r} (*{_to_hepburn(r)}*)" for r in kun_readings)
-    on_chunk: str = ", ".join(f"{r} (*{_to_hepburn(r)}*)" for r in on_readings)
+    kun_chunk: str = ", ".join(
+        f"{r} (*{h}*)" for r, h in zip(kun_readings, kun_romaji, strict=True)
+    )
+    on_chunk: str = ", ".join(
+        f"{r} (*{h}*)" for r, h in zip(on_readings, on_romaji, strict=True)
+    )
 
     return kun_chunk, on_chunk
 
@@ -80,10 +399,10 @@ def _format_kun_on_readings(tree: Any) -> tuple[str, str]:
 # ─── Character lookup ─────────────────────────────────────────────────────────
 
 
-def _ja_character_fetch(character: str) -> str:
+async def _ja_character_fetch(character: str) -> str:
     """
     Internal function to fetch Japanese character data from web sources.
-    This is called by ja_character when cache miss occurs.
+    This is called by ja_character_async when cache miss occurs.
 
     :param character: A kanji or single hiragana. This function will not
                       work with individual katakana.
@@ -91,24 +410,16 @@ def _ja_character_fetch(character: str) -> str:
     """
     is_kana: bool = False
     multi_mode: bool = len(character) > 1
-    multi_character_dict: dict[str, dict[str, str]] = {}
 
-    kana_test: re.Match | None = re.search(
-        "[\u3040-\u309f]", character
-    )  # Hiragana Unicode block
+    kana_test: re.Match | None = _HIRAGANA_RE.search(character)
 
+    session = await _get_client_session()
     if kana_test:
         kana: str = kana_test.group(0)
-        response = requests.get(
-            f"https://jisho.org/search/{character}%20%23particle",
-            headers=useragent,
-            timeout=DEFAULT_HTTP_TIMEOUT,
-        )
-        response.raise_for_status()
-        tree = html.fromstring(response.content)
-        meaning_list: list[str] = tree.xpath(
-            '//span[contains(@class,"meaning-meaning")]/text()'
+        tree = await _fetch_page(
+            session, f"https://jisho.org/search/{character}%20%23particle"
         )
+        meaning_list: list[str] = _XP_PARTICLE_MEANINGS(tree)
         meaning: str = " / ".join(meaning_list)
         is_kana = True
 
@@ -118,17 +429,11 @@ def _ja_character_fetch(character: str) -> str:
 
     elif not multi_mode:
         # Single kanji mode
-        response = requests.get(
-            f"https://jisho.org/search/{character}%20%23kanji",
-            headers=useragent,
-            timeout=DEFAULT_HTTP_TIMEOUT,
+        tree = await _fetch_page(
+            session, f"https://jisho.org/search/{character}%20%23kanji"
         )
-        response.raise_for_status()
-        tree = html.fromstring(response.content)
 
-        meanings: list[str] = tree.xpath(
-            '//div[contains(@class,"kanji-details__main-meanings")]/text()'
-        )
+        meanings: list[str] = _XP_KANJI_MEANINGS(tree)
         meaning = " / ".join(meanings).strip()
 
         if not meaning:
@@ -145,7 +450,9 @@ def _ja_character_fetch(character: str) -> str:
         )
         lookup_line_1 += f"**Kun-readings:** {kun_chunk}\n\n**On-readings:** {on_chunk}"
 
-        calligraphy_image: str | None = calligraphy_search(character)
+        calligraphy_image: str | None = await call_sync_async(
+            calligraphy_search, character
+        )
         if calligraphy_image:
             lookup_line_1 += calligraphy_image
 
@@ -153,53 +460,44 @@ def _ja_character_fetch(character: str) -> str:
         total_data = lookup_line_1 + lookup_line_2
 
     else:
-        # Multi-kanji mode
-        ooi_key: str = f"# {character}"
-        ooi_header: str = "\n\n| Character"
-        ooi_separator: str = "\n| ---"
-        ooi_kun: str = "\n| **Kun-readings**"
-        ooi_on: str = "\n| **On-readings**"
-        ooi_meaning: str = "\n| **Meanings**"
-
-        for moji in character:
-            response = requests.get(
-                f"https://jisho.org/search/{moji}%20%23kanji",
-                headers=useragent,
-                timeout=DEFAULT_HTTP_TIMEOUT,
+        # Multi-kanji mode: every kanji page is requested at once, so the
+        # lookup takes about one round trip instead of one per character.
+        trees: list[Any] = await asyncio.gather(
+            *(
+                _fetch_page(session, f"https://jisho.org/search/{moji}%20%23kanji")
+                for moji in character
             )
-            response.raise_for_status()
-            tree = html.fromstring(response.content)
+        )
 
+        header_parts: list[str] = ["\n\n| Character"]
+        separator_parts: list[str] = ["\n| ---"]
+        kun_parts: list[str] = ["\n| **Kun-readings**"]
+        on_parts: list[str] = ["\n| **On-readings**"]
+        meaning_parts: list[str] = ["\n| **Meanings**"]
+
+        for moji, tree in zip(character, trees, strict=True):
             kun_chunk, on_chunk = _format_kun_on_readings(tree)
 
-            meanings = tree.xpath(
-                '//div[contains(@class,"kanji-details__main-meanings")]/text()'
-            )
+            meanings = _XP_KANJI_MEANINGS(tree)
             meaning = f'"{" / ".join(meanings).strip()}."'
 
-            multi_character_dict[moji] = {
-                "kun": kun_chunk,
-                "on": on_chunk,
-                "meaning": meaning,
-            }
-
-        # Construct Markdown table from individual kanji
-        for moji in character:
-            data = multi_character_dict[moji]
-            ooi_header += f" | [{moji}](https://en.wiktionary.org/wiki/{moji}#Japanese)"
-            ooi_separator += " | ---"
-            ooi_kun += f" | {data['kun']}"
-            ooi_on += f" | {data['on']}"
-            ooi_meaning += f" | {data['meaning']}"
-
-        ooi_header += " |"
-        ooi_separator += " |"
-        ooi_kun += " |"
-        ooi_on += " |"
-        ooi_meaning += " |"
-
-        total_data = (
-            ooi_key + ooi_header + ooi_separator + ooi_kun + ooi_on + ooi_meaning
+            header_parts.append(
+                f" | [{moji}](https://en.wiktionary.org/wiki/{moji}#Japanese)"
+            )
+            separator_parts.append(" | ---")
+            kun_parts.append(f" | {kun_chunk}")
+            on_parts.append(f" | {on_chunk}")
+            meaning_parts.append(f" | {meaning}")
+
+        table_rows: list[list[str]] = [
+            header_parts,
+            separator_parts,
+            kun_parts,
+            on_parts,
+            meaning_parts,
+        ]
+        total_data = f"# {character}" + "".join(
+            "".join(row) + " |" for row in table_rows
         )
 
     lookup_line_3: str
@@ -233,7 +531,7 @@ def _ja_character_fetch(character: str) -> str:
     return total_data + lookup_line_3
 
 
-def ja_character(character: str) -> str:
+async def ja_character_async(character: str) -> str:
     """
     Looks up a Japanese kanji or hiragana character's readings and meanings with caching support.
     Checks cache first, falls back to web fetch if not found.
@@ -250,50 +548,130 @@ def ja_character(character: str) -> str:
         return format_ja_character_from_cache(cached) + " ^⚡"
 
     logger.info(f"'{character}' not found in cache, fetching from web.")
-    return _ja_character_fetch(character)
+    return await _ja_character_fetch(character)
+
+
+def ja_character(character: str) -> str:
+    """
+    Synchronous wrapper around ja_character_async for callers outside an
+    event loop. Code already running in a loop should await
+    ja_character_async instead.
+
+    :param character: A kanji or single hiragana. This function will not
+                      work with individual katakana.
+    :return: A formatted string with readings, meanings, and resource links.
+    """
+
+    async def _lookup() -> str:
+        try:
+            return await ja_character_async(character)
+        finally:
+            await close_client_session()
+
+    return asyncio.run(_lookup())
 
 
 # ─── Word lookup ──────────────────────────────────────────────────────────────
 
+# The onomatopoeia dictionary renders its results with JavaScript, so SFX
+# lookups need a real browser. Launching one costs a few seconds, so a single
+# headless instance is kept for the life of the process. Lookups run in
+# executor threads, so access is serialized with a thread lock. Selenium itself
+# is only imported once an SFX lookup actually needs the browser.
+_sfx_driver: "webdriver.Chrome | None" = None
+_sfx_driver_lock = threading.Lock()
+_SFX_RENDER_TIMEOUT: int = 5  # seconds
+
+
+def _get_sfx_driver() -> "webdriver.Chrome":
+    """
+    Return the shared headless Chrome driver, launching it on first use.
+    Callers must hold `_sfx_driver_lock`.
+    """
+    global _sfx_driver
+    if _sfx_driver is None:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+        options = ChromeOptions()
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-software-rasterizer")
+
+        _sfx_driver = webdriver.Chrome(options=options)
+        logger.debug("Launched headless browser for SFX lookups.")
+    return _sfx_driver
+
+
+def _quit_sfx_driver() -> None:
+    """Shut down the shared SFX driver, if one has been launched."""
+    global _sfx_driver
+    if _sfx_driver is None:
+        return
+    try:
+        _sfx_driver.quit()
+    except Exception as e:
+        logger.debug(f"Error shutting down SFX browser: {e}")
+    finally:
+        _sfx_driver = None
+
+
+atexit.register(_quit_sfx_driver)
+
 
 def _sfx_search(katakana_string: str) -> str | None:
     """Search a Japanese onomatopoeia dictionary for a term. Best for
     things like sound effects (frequently present in manga)."""
-    if not re.search(r"[\u30A0-\u30FF]", katakana_string):
+    if not _KATAKANA_RE.search(katakana_string):
         return None
 
-    search_url: str = f"https://nsk.sh/tools/jp-onomatopoeia/?term={katakana_string}"
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions
+    from selenium.webdriver.support.ui import WebDriverWait
 
-    options = ChromeOptions()
-    options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--disable-software-rasterizer")
+    search_url: str = f"https://nsk.sh/tools/jp-onomatopoeia/?term={katakana_string}"
 
-    driver = webdriver.Chrome(options=options)
+    with _sfx_driver_lock:
+        try:
+            driver = _get_sfx_driver()
+            driver.get(search_url)
+            try:
+                # Wait for the client-side render instead of a fixed delay.
+                # Pages with no entry never render a heading, so a timeout
+                # just means there is nothing to parse.
+                WebDriverWait(driver, _SFX_RENDER_TIMEOUT).until(
+                    expected_conditions.presence_of_element_located(
+                        (By.CSS_SELECTOR, "main h3")
+                    )
+                )
+            except TimeoutException:
+                logger.debug(f"No SFX entry rendered for {katakana_string}.")
+            page_source: str = driver.page_source
+        except Exception as e:
+            # Discard a crashed or hung browser so the next lookup relaunches it.
+            logger.warning(f"Error searching for {katakana_string} as SFX: {e}")
+            _quit_sfx_driver()
+            return None
 
     try:
-        driver.get(search_url)
-        sleep(2)  # Let JS render
-
-        tree = html.fromstring(driver.page_source)
+        tree = html.fromstring(page_source, parser=_HTML_PARSER)
 
-        container = tree.xpath("//main/div/div/div[1]/div")[0]
+        container = _XP_SFX_CONTAINER(tree)[0]
 
-        h3_elem = container.xpath(".//h3[1]")
-        ul_elem = container.xpath(".//ul[1]")
+        h3_elem = _XP_SFX_HEADING(container)
+        ul_elem = _XP_SFX_LIST(container)
 
         if not h3_elem or not ul_elem:
             return None
 
-        match_text: list[str] = tree.xpath(
-            "/html/body/main/div/div/div[1]/div/div/div[1]/h3/text()"
-        )
+        match_text: list[str] = _XP_SFX_MATCH_TEXT(container)
         match_text_str: str | None = match_text[0].strip() if match_text else None
         meanings: list[str] = [
             li.text_content().strip()
-            for li in ul_elem[0].xpath("./li")
+            for li in _XP_SFX_LIST_ITEMS(ul_elem[0])
             if li.text_content().strip()
         ]
 
@@ -324,15 +702,16 @@ def _sfx_search(katakana_string: str) -> str | None:
     except Exception as e:
         logger.warning(f"Error searching for {katakana_string} as SFX: {e}")
         return None
-    finally:
-        driver.quit()
 
 
-def _ja_name_search(ja_given_name: str) -> str | None:
+async def _ja_name_search(
+    session: aiohttp.ClientSession, ja_given_name: str
+) -> str | None:
     """
     Gets the kanji readings of Japanese given names, including names not in dictionaries.
     Also returns readings for place names such as temples.
 
+    :param session: An active aiohttp session used for the request.
     :param ja_given_name: A Japanese given name, in kanji only.
     :return: A formatted Markdown section with readings and a placeholder
              meaning if valid. Otherwise, returns None.
@@ -341,20 +720,20 @@ def _ja_name_search(ja_given_name: str) -> str | None:
 
     url: str = f"https://kanji.reader.bz/{ja_given_name}"
     try:
-        eth_page = requests.get(url, headers=useragent, timeout=DEFAULT_HTTP_TIMEOUT)
-        eth_page.raise_for_status()
-    except requests.RequestException as e:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            content: bytes = await response.read()
+    except (TimeoutError, aiohttp.ClientError) as e:
         logger.warning(f"Name lookup unavailable for '{ja_given_name}': {e}")
         return None
 
-    tree = html.fromstring(eth_page.content)
+    tree = html.fromstring(content, parser=_HTML_PARSER)
 
-    name_content: list[str] = tree.xpath('//div[contains(@id,"main")]/p[1]/text()')
-    hiragana_content: list[str] = tree.xpath(
-        '//div[contains(@id,"main")]/p[1]/a/text()'
-    )
+    name_content: list[str] = _XP_NAME_KANJI(tree)
+    hiragana_content: list[str] = _XP_NAME_HIRAGANA(tree)
 
-    logger.debug(name_content)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Name lookup page text for {ja_given_name}: {name_content}")
     logger.info(f"Name lookup: {hiragana_content=}")
     if not hiragana_content:
         return None
@@ -380,12 +759,15 @@ def _ja_name_search(ja_given_name: str) -> str | None:
     return formatted_section
 
 
-def _ja_word_yojijukugo(yojijukugo: str) -> str | None:
+async def _ja_word_yojijukugo(
+    session: aiohttp.ClientSession, yojijukugo: str
+) -> str | None:
     """
     Retrieves meaning and explanation for a four-kanji Japanese idiom (yojijukugo).
     Examples of such idioms can be found at this website:
     https://www.edrdg.org/projects/yojijukugo.html
 
+    :param session: An active aiohttp session used for the requests.
     :param yojijukugo: Four-kanji Japanese idiom.
     :return: Formatted string with explanation and source,
              or None if not found.
@@ -399,17 +781,10 @@ def _ja_word_yojijukugo(yojijukugo: str) -> str | None:
         contain_url: str = f"https://yoji.jitenon.jp/kanji/{first_char}/contain/"
         logger.debug(f"Looking up {yojijukugo} via contain page: {contain_url}")
 
-        contain_resp = requests.get(
-            contain_url, headers=useragent, timeout=DEFAULT_HTTP_TIMEOUT
-        )
-        contain_resp.raise_for_status()
-        contain_resp.encoding = contain_resp.apparent_encoding
-        contain_tree = html.fromstring(contain_resp.text)
+        contain_tree = await _fetch_page(session, contain_url)
 
         # Link text is formatted as "四字熟語（よみ）"; match on the kanji prefix.
-        entry_links: list[str] = contain_tree.xpath(
-            f"//a[starts-with(normalize-space(text()), '{yojijukugo}')]/@href"
-        )
+        entry_links: list[str] = _XP_YOJI_ENTRY_LINKS(contain_tree, word=yojijukugo)
         if not entry_links:
             logger.warning(f"No entry link found for {yojijukugo} on contain page.")
             return None
@@ -419,35 +794,43 @@ def _ja_word_yojijukugo(yojijukugo: str) -> str | None:
             entry_url = "https://yoji.jitenon.jp" + entry_url
         logger.debug(f"Following entry link: {entry_url}")
 
-        entry_resp = requests.get(
-            entry_url, headers=useragent, timeout=DEFAULT_HTTP_TIMEOUT
-        )
-        entry_resp.raise_for_status()
-        entry_resp.encoding = entry_resp.apparent_encoding
-        tree = html.fromstring(entry_resp.text)
+        async with session.get(entry_url) as entry_resp:
+            entry_resp.raise_for_status()
 
-        # Verify the entry page actually matches our input via the 四字熟語 row.
-        # The site uses consistent shinjitai, so this catches wrong-entry redirects.
-        def _get_row_by_label(label: str) -> str | None:
-            """Return the <td> text of the first table row whose <th> matches label."""
-            nodes = tree.xpath(f"//table//tr[th[normalize-space(text())='{label}']]/td")
-            if not nodes:
+            # A missing entry bounces back to the site's search page, so
+            # there is nothing worth downloading or parsing.
+            final_url: str = str(entry_resp.url)
+            if final_url.endswith("search.php"):
+                logger.warning(f"Entry for {yojijukugo} redirected to {final_url}.")
                 return None
-            raw = nodes[0].text_content().replace("\r", "\n").strip()
-            text = " ".join(line.strip() for line in raw.splitlines() if line.strip())
-            return text.split("※")[0].strip()
 
-        reading: str | None = _get_row_by_label("読み方")
-        explanation: str | None = _get_row_by_label("意味")
-        source: str | None = _get_row_by_label("出典")
+            tree = await _parse_response(entry_resp)
+
+        # Collect the text of the labelled rows we need in one pass over the
+        # tree, keeping the first row for each <th> label.
+        rows: dict[str, str] = {}
+        for row in _XP_YOJI_ROWS(tree):
+            label: str = " ".join(row.find("th").text_content().split())
+            if label in rows:
+                continue
+            cell = row.find("td")
+            raw = cell.text_content().replace("\r", "\n").strip()
+            text = " ".join(line.strip() for line in raw.splitlines() if line.strip())
+            rows[label] = text.split("※")[0].strip()
 
-        entry_word: str | None = _get_row_by_label("四字熟語")
+        # Verify the entry page actually matches our input via the 四字熟語 row.
+        # The site uses consistent shinjitai, so this catches wrong-entry redirects.
+        entry_word: str | None = rows.get("四字熟語")
         if entry_word and entry_word != yojijukugo:
             logger.warning(
                 f"Entry mismatch: searched for {yojijukugo}, got {entry_word} at {entry_url}"
             )
             return None
 
+        reading: str | None = rows.get("読み方")
+        explanation: str | None = rows.get("意味")
+        source: str | None = rows.get("出典")
+
         if not explanation:
             logger.warning(f"No explanation found for {yojijukugo} at {entry_url}")
             return None
@@ -472,7 +855,7 @@ def _ja_word_yojijukugo(yojijukugo: str) -> str | None:
 
         return formatted_section
 
-    except requests.RequestException as e:
+    except (TimeoutError, aiohttp.ClientError) as e:
         logger.error(f"Network error retrieving {yojijukugo}: {e}")
         return None
     except Exception as e:
@@ -480,6 +863,30 @@ def _ja_word_yojijukugo(yojijukugo: str) -> str | None:
         return None
 
 
+async def _first_found(
+    probes: list[tuple[str, Awaitable[str | None]]],
+) -> tuple[str, str] | None:
+    """
+    Runs fallback probes concurrently and returns the first positive result
+    in priority order. Once a probe has answered, the lower-priority ones
+    still in flight are cancelled rather than awaited.
+
+    :param probes: (description, awaitable) pairs, highest priority first.
+    :return: The description and result of the winning probe, or None.
+    """
+    tasks: list[asyncio.Future] = [asyncio.ensure_future(probe) for _, probe in probes]
+    try:
+        for (description, _), task in zip(probes, tasks, strict=True):
+            result: str | None = await task
+            if result:
+                return description, result
+        return None
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
 async def _ja_word_fetch(japanese_word: str) -> str | None:
     """
     Internal function to fetch Japanese word data from web sources.
@@ -493,8 +900,8 @@ async def _ja_word_fetch(japanese_word: str) -> str | None:
         f"https://jisho.org/api/v1/search/words?keyword={japanese_word}%20%23words"
     )
 
-    async with aiohttp.ClientSession() as session:
-        word_data: dict | list | None = await fetch_json(session, url)
+    session = await _get_client_session()
+    word_data: dict | list | None = await fetch_json(session, url)
 
     if not word_data or not isinstance(word_data, dict) or not word_data.get("data"):
         logger.warning(f"No JSON or empty data for `{japanese_word}`.")
@@ -508,33 +915,45 @@ async def _ja_word_fetch(japanese_word: str) -> str | None:
     if not word_reading:
         logger.info(f"No results for '{japanese_word}' on Jisho.")
 
-        katakana_test: re.Match | None = re.search(r"[\u30a0-\u30ff]", japanese_word)
-        name_data: str | None = None
+        katakana_test: re.Match | None = _KATAKANA_RE.search(japanese_word)
+        # The fallback sources are independent, so the applicable ones run
+        # concurrently. Only katakana words can be sound effects.
+        probes: list[tuple[str, Awaitable[str | None]]] = []
         if len(japanese_word) == 2:
-            name_data = await call_sync_async(_ja_name_search, japanese_word)
-        elif len(japanese_word) == 4:
-            yojijukugo_data = await call_sync_async(_ja_word_yojijukugo, japanese_word)
-        sfx_data: str | None = await call_sync_async(_sfx_search, japanese_word)
-
-        if not any([name_data, sfx_data, yojijukugo_data]):
-            if not katakana_test:
-                logger.info("No matches. Falling back to single-character lookup.")
-                return await call_sync_async(ja_character, japanese_word)
-            else:
-                logger.info("Unknown katakana word.")
-                return None
+            probes.append(
+                ("a Japanese name/surname", _ja_name_search(session, japanese_word))
+            )
+        if len(japanese_word) == 4:
+            probes.append(
+                (
+                    "a Japanese yojijukugo (proverb)",
+                    _ja_word_yojijukugo(session, japanese_word),
+                )
+            )
+        if katakana_test:
+            probes.append(
+                (
+                    "a Japanese sound effect",
+                    call_sync_async(_sfx_search, japanese_word),
+                )
+            )
 
-        if name_data:
-            logger.info("> Found a Japanese name/surname.")
-            return name_data
+        found: tuple[str, str] | None = await _first_found(probes)
+        if found:
+            description, fallback_data = found
+            logger.info(f"> Found {description}.")
+            return fallback_data
 
-        if yojijukugo_data:
-            logger.info("> Found a Japanese yojijukugo (proverb).")
-            return yojijukugo_data
+        if not katakana_test:
+            logger.info("No matches. Falling back to single-character lookup.")
+            return await ja_character_async(japanese_word)
 
-        if sfx_data:
-            logger.info("> Found a Japanese sound effect.")
-            return sfx_data
+        logger.info("Unknown katakana word.")
+        return None
+
+    # For 4-char words, a yojijukugo explanation is appended as a supplement.
+    if main_data and len(japanese_word) == 4:
+        yojijukugo_data = await _ja_word_yojijukugo(session, japanese_word)
 
     if main_data:
         word_reading_chunk: str = f"{word_reading} (*{_to_hepburn(word_reading)}*)"
@@ -550,14 +969,11 @@ async def _ja_word_fetch(japanese_word: str) -> str | None:
             f"**Meanings**: {word_meaning}"
         )
 
-        # For 4-char words, append yojijukugo explanation as a supplement.
-        if len(japanese_word) == 4:
-            yojijukugo_data = await call_sync_async(_ja_word_yojijukugo, japanese_word)
-            if yojijukugo_data:
-                logger.info("> Appending yojijukugo supplement to Jisho result.")
-                # Strip the standalone footer since the main Jisho footer follows.
-                yoji_body: str = yojijukugo_data.rsplit("\n\n^(Information from)", 1)[0]
-                return_comment += f"\n\n---\n\n{yoji_body}"
+        if yojijukugo_data:
+            logger.info("> Appending yojijukugo supplement to Jisho result.")
+            # Strip the standalone footer since the main Jisho footer follows.
+            yoji_body: str = yojijukugo_data.rsplit("\n\n^(Information from)", 1)[0]
+            return_comment += f"\n\n---\n\n{yoji_body}"
 
         footer: str = (
             f"\n\n^Information ^from ^[Jisho](https://jisho.org/search/{japanese_word}%23words) ^| "
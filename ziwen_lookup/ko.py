@@ -7,10 +7,13 @@ Contains functions that deal with Korean-language content.
 Logger tag: [L:KO]
 """
 
+import asyncio
+import functools
 import logging
+import threading
+from collections import OrderedDict
 
 import krdict
-from korean_romanizer.romanizer import Romanizer
 
 from config import Paths, load_settings
 from config import logger as _base_logger
@@ -23,46 +26,98 @@ from ziwen_lookup.cache_helpers import (
 
 logger = logging.LoggerAdapter(_base_logger, {"tag": "L:KO"})
 
-api_settings = load_settings(Paths.AUTH["API"])
-krdict.set_key(api_settings["KRDICT_API_KEY"])
+# Whether the KRDict API key has been registered with the client yet.
+_krdict_key_set: bool = False
+
+# Recent KRDict search results, keyed by word. Searches run in worker
+# threads, so access is serialized with a lock. Failed searches are not
+# stored, so a transient API error is retried on the next lookup.
+_SEARCH_CACHE_SIZE = 2048
+_search_cache: OrderedDict[str, dict[str, list[dict]]] = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+# Most KRDict requests that ko_words_bulk keeps in flight at once, and the
+# seconds between the start of one of its lookups and the next, so a comment
+# with many Korean words does not send the API a burst of requests.
+KRDICT_MAX_CONCURRENT = 4
+KRDICT_REQUEST_INTERVAL = 1.0
 
 
 # ─── Internal helpers ─────────────────────────────────────────────────────────
 
 
+def _ensure_krdict_key() -> None:
+    """Registers the KRDict API key on first use, so importing this module
+    does not read the credentials file."""
+    global _krdict_key_set
+    if _krdict_key_set:
+        return
+
+    api_settings = load_settings(Paths.AUTH["API"])
+    krdict.set_key(api_settings["KRDICT_API_KEY"])
+    _krdict_key_set = True
+
+
+# Korean part-of-speech labels used by KRDict, mapped to English.
+_POS_MAP: dict[str, str] = {
+    "명사": "noun",
+    "동사": "verb",
+    "형용사": "adjective",
+    "부사": "adverb",
+    "대명사": "pronoun",
+    "전치사": "preposition",
+    "접속사": "conjunction",
+    "감탄사": "interjection",
+    "조사": "particle",
+    "수사": "numeral",
+    "관형사": "determiner",
+    "의존 명사": "dependent noun",
+}
+
+
 def _translate_part_of_speech(korean_pos: str) -> str:
     """Translates the dictionary's Korean part of speech to its English
     equivalent."""
-    mapping: dict[str, str] = {
-        "명사": "noun",
-        "동사": "verb",
-        "형용사": "adjective",
-        "부사": "adverb",
-        "대명사": "pronoun",
-        "전치사": "preposition",
-        "접속사": "conjunction",
-        "감탄사": "interjection",
-        "조사": "particle",
-        "수사": "numeral",
-        "관형사": "determiner",
-        "의존 명사": "dependent noun",
-    }
-    return mapping.get(korean_pos, korean_pos)
-
-
-def _ko_search_raw(target_word: str) -> list[dict]:
+    return _POS_MAP.get(korean_pos, korean_pos)
+
+
+@functools.lru_cache(maxsize=4096)
+def _romanize_ko(korean_text: str) -> str:
+    """Returns the Revised Romanization of the input. Results are memoized,
+    since each Romanizer instance rebuilds its rule tables."""
+    from korean_romanizer.romanizer import Romanizer
+
+    return Romanizer(korean_text).romanize()
+
+
+def _ko_search_raw(target_word: str) -> dict[str, list[dict]]:
     """
-    This function returns a list containing machine-readable
-    dictionaries of data from the Korean look-up.
+    This function returns machine-readable dictionaries of data from the
+    Korean look-up, grouped by part of speech.
 
     :param target_word: Word in Korean we're looking for.
-    :return: List of simplified entry dictionaries.
+    :return: Dictionary mapping each English part of speech (e.g. 'Noun')
+             to its simplified entry dictionaries, in KRDict's order. Each
+             entry carries the English glosses of all its senses as one
+             flat list under `english_definitions`; entries without any
+             are left out.
+             The result is shared with the search cache and must not be
+             modified.
     """
-    filtered_data: list[dict] = []
+    target_word = target_word.strip()
+    with _search_cache_lock:
+        cached: dict[str, list[dict]] | None = _search_cache.get(target_word)
+        if cached is not None:
+            _search_cache.move_to_end(target_word)
+            return cached
+
+    _ensure_krdict_key()
+
+    filtered_data: dict[str, list[dict]] = {}
     for attempt in range(3):
         try:
             korean_input = krdict.search(
-                query=target_word.strip(),
+                query=target_word,
                 search_type=krdict.SearchType.WORD,
                 translation_language=krdict.TranslationLanguage.ENGLISH,
                 raise_api_errors=True,
@@ -73,36 +128,40 @@ def _ko_search_raw(target_word: str) -> list[dict]:
                 logger.warning(
                     f"Korean lookup failed for '{target_word}' after 3 attempts: {e}"
                 )
-                return []
+                return {}
             logger.debug(
                 f"Korean lookup attempt {attempt + 1} failed for '{target_word}', retrying: {e}"
             )
     else:
-        return []
+        return {}
 
     for entry in korean_input.data.results:
         if entry.word == target_word:
+            # Only the English glosses are ever displayed, so the Korean
+            # definition text and the other languages are dropped here, and
+            # the senses are flattened into a single list of glosses.
+            english_definitions: list[str] = [
+                t.definition
+                for definition in entry.definitions
+                for t in definition.translations
+                if t.language == "영어"
+            ]
+            if not english_definitions:
+                continue
+
             simplified_entry: dict = {
                 "word": entry.word,
                 "origin": entry.origin,
                 "part_of_speech": entry.part_of_speech,
-                "definitions": [],
+                "english_definitions": english_definitions,
             }
-            for definition in entry.definitions:
-                simplified_definition: dict = {
-                    "definition": definition.definition,
-                    "translations": [
-                        {
-                            "word": t.word,
-                            "definition": t.definition,
-                            "language": t.language,
-                        }
-                        for t in definition.translations
-                    ],
-                }
-                simplified_entry["definitions"].append(simplified_definition)
-
-            filtered_data.append(simplified_entry)
+            pos: str = _translate_part_of_speech(entry.part_of_speech).title()
+            filtered_data.setdefault(pos, []).append(simplified_entry)
+
+    with _search_cache_lock:
+        _search_cache[target_word] = filtered_data
+        if len(_search_cache) > _SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
 
     return filtered_data
 
@@ -116,41 +175,35 @@ def _ko_word_fetch(korean_word: str) -> str | None:
     :return: A Markdown formatted string, or None.
     """
     korean_word = korean_word.strip()
-    data: list[dict] = _ko_search_raw(korean_word)
-    hangul_romanization: str = Romanizer(korean_word).romanize()
+    data: dict[str, list[dict]] = _ko_search_raw(korean_word)
 
     if not data:
         return None
 
+    hangul_romanization: str = _romanize_ko(korean_word)
+
     lookup_header: str = (
         f"# [{korean_word}](https://en.wiktionary.org/wiki/{korean_word}#Korean)"
     )
 
-    pos_groups: dict[str, list[dict]] = {}
-    for entry in data:
-        pos: str = _translate_part_of_speech(entry["part_of_speech"]).title()
-        if pos not in pos_groups:
-            pos_groups[pos] = []
-        pos_groups[pos].append(entry)
-
-    entries: list[str] = []
-    for pos, group in pos_groups.items():
-        pos_section: str = f"\n\n##### *{pos}*\n\n"
-
-        definitions_list: list[str] = []
-        for entry in group:
-            for x in entry["definitions"]:
-                for t in x.get("translations", []):
-                    if t.get("language") == "영어":
-                        definition_text: str = t.get("definition")
-                        origin: str | None = entry.get("origin")
-                        if origin:
-                            definition_text = f"[{origin}](https://en.wiktionary.org/wiki/{origin}): {definition_text}"
-                        definitions_list.append(definition_text)
-
-        definitions: str = "\n* ".join(definitions_list)
-        pos_section += f"**Romanization:** *{hangul_romanization}*\n\n**Meanings**:\n* {definitions}"
-        entries.append(pos_section)
+    # Every piece of the comment is collected here and joined once.
+    sections: list[str] = [lookup_header]
+    for pos, group in data.items():
+        definitions_list: list[str] = [
+            (
+                f"[{entry['origin']}](https://en.wiktionary.org/wiki/{entry['origin']}): {d}"
+                if entry["origin"]
+                else d
+            )
+            for entry in group
+            for d in entry["english_definitions"]
+        ]
+
+        sections.append(
+            f"\n\n##### *{pos}*\n\n"
+            f"**Romanization:** *{hangul_romanization}*\n\n**Meanings**:\n* "
+        )
+        sections.append("\n* ".join(definitions_list))
 
     footer: str = (
         "\n\n^Information ^from "
@@ -160,7 +213,7 @@ def _ko_word_fetch(korean_word: str) -> str | None:
         f"^[Collins](https://www.collinsdictionary.com/dictionary/korean-english/{korean_word})"
     )
 
-    final_comment: str = lookup_header + "".join(entries) + footer
+    final_comment: str = "".join([*sections, footer])
 
     try:
         parsed_data = parse_ko_output_to_json(final_comment)
@@ -193,3 +246,50 @@ def ko_word(korean_word: str) -> str | None:
 
     logger.info(f"'{korean_word}' not found in cache, fetching from API.")
     return _ko_word_fetch(korean_word)
+
+
+async def ko_word_async(korean_word: str) -> str | None:
+    """
+    Async counterpart of ko_word for callers already inside an event loop.
+    The cache read and the KRDict request block, so both run in worker
+    threads and other lookups can proceed meanwhile.
+
+    :param korean_word: A word in Korean.
+    :return: A Markdown formatted string, or None.
+    """
+    korean_word = korean_word.strip()
+
+    cached = await asyncio.to_thread(get_from_cache, korean_word, "ko", "ko_word")
+
+    if cached and cached.get("word"):
+        logger.info(f"Retrieved '{korean_word}' from cache.")
+        return format_ko_word_from_cache(cached) + " ^⚡"
+
+    logger.info(f"'{korean_word}' not found in cache, fetching from API.")
+    return await asyncio.to_thread(_ko_word_fetch, korean_word)
+
+
+async def ko_words_bulk(korean_words: list[str]) -> dict[str, str | None]:
+    """
+    Looks up several Korean words at once. Each word goes through
+    ko_word_async concurrently, so the KRDict requests overlap instead of
+    running one after another. Lookups start KRDICT_REQUEST_INTERVAL
+    seconds apart, and no more than KRDICT_MAX_CONCURRENT run at the same
+    time.
+
+    :param korean_words: Words in Korean.
+    :return: Dictionary mapping each stripped word to its Markdown
+             formatted result, or None.
+    """
+    words: list[str] = list(dict.fromkeys(word.strip() for word in korean_words))
+    semaphore = asyncio.Semaphore(KRDICT_MAX_CONCURRENT)
+
+    async def limited_lookup(index: int, word: str) -> str | None:
+        await asyncio.sleep(index * KRDICT_REQUEST_INTERVAL)
+        async with semaphore:
+            return await ko_word_async(word)
+
+    results: list[str | None] = await asyncio.gather(
+        *(limited_lookup(index, word) for index, word in enumerate(words))
+    )
+    return dict(zip(words, results, strict=True))
@@ -16,10 +16,12 @@ To install it, run:
 Logger tag: [L:MATCH]
 """
 
+import functools
 import logging
 import os
 import re
-from typing import Any
+import threading
+from collections import OrderedDict, defaultdict
 
 import MeCab  # mecab-python3
 import rjieba as jieba
@@ -28,14 +30,63 @@ from kiwipiepy import Kiwi
 
 from config import Paths, load_settings
 from config import logger as _base_logger
-from integrations.http import get_random_useragent
 from lang.languages import converter
 from title.title_handling import extract_lingvos_from_text
 from ziwen_lookup import BACKTICK_LOOKUP_PATTERN
+from ziwen_lookup.zh import simplify
 
 logger = logging.LoggerAdapter(_base_logger, {"tag": "L:MATCH"})
 
-useragent = get_random_useragent()
+# Cached {code: zh/ja/ko} map from language settings
+_cjk_code_map_cache: dict[str, str] | None = None
+
+
+# ─── Patterns ─────────────────────────────────────────────────────────────────
+
+# Compiled once, since every comment scanned runs through these.
+_RICH_TEXT_ESCAPE_RE = re.compile(r"\\([`*_{}\[\]()#+\-.!|>,;:?])")
+_TRIPLE_BACKTICK_RE = re.compile(r"```.*?```", re.DOTALL)
+_IDENTIFY_COMMAND_RE = re.compile(r"!(?:identify|id):\s*(\S+)")
+_HANZI_RUN_RE = re.compile(r"[\u2E80-\u9FFF\U00020000-\U0002EBEF]+")
+_HANGUL_RUN_RE = re.compile(r"[\uac00-\ud7af]+")
+
+# Joins Hanzi runs so that Jieba can segment them in one pass. Jieba keeps
+# control characters apart from words, so it comes back as its own token.
+_RUN_SEPARATOR = "\x01"
+
+# Tokens starting with one of these are punctuation and are not looked up.
+# Tokens are only a few characters long, so a set membership test on the
+# first character is cheaper than running a regex over each of them.
+_PUNCTUATION_CHARS: frozenset[str] = frozenset(
+    ".!/_,$%^*+\"'[]—！，。？、~@#￥…&（）：「」『』《》»％〔〕；"
+)
+
+# One pass over a segment classifies each run of script characters. Kana sits
+# inside the broad CJK range, so the Hanzi alternative excludes it here and
+# _detect_scripts counts kana as Hanzi as well.
+_SCRIPT_RUN_RE = re.compile(
+    r"(?P<kana>[\u3041-\u309f\u30a0-\u30ff]+)"
+    r"|(?P<hanzi>[\u2E80-\u3040\u3100-\u9FFF\U00020000-\U0002EBEF]+)"
+    r"|(?P<hangul>[\uac00-\ud7af]+)"
+)
+
+
+def _detect_scripts(text: str) -> tuple[bool, bool, bool]:
+    """
+    Report which CJK scripts appear in a text, stopping early once all
+    three have been seen.
+
+    :param text: The text to check.
+    :return: Whether it has Hanzi (including kana), kana, and Hangul.
+    """
+    found: set[str | None] = set()
+    for script_match in _SCRIPT_RUN_RE.finditer(text):
+        found.add(script_match.lastgroup)
+        if len(found) == 3:
+            break
+
+    has_kana: bool = "kana" in found
+    return "hanzi" in found or has_kana, has_kana, "hangul" in found
 
 
 def _remove_reddit_rich_text_escapes(text: str) -> str:
@@ -45,11 +96,70 @@ def _remove_reddit_rich_text_escapes(text: str) -> str:
     The Markdown editor can store a lookup as `銀`; if the closing
     backtick remains escaped, the matcher captures `銀` as the lookup term.
     """
-    return re.sub(r"\\([`*_{}\[\]()#+\-.!|>,;:?])", r"\1", text)
+    return _RICH_TEXT_ESCAPE_RE.sub(r"\1", text)
+
+
+def _remove_triple_backtick_blocks(text: str) -> str:
+    """
+    Remove every ```...``` block from a text. Most comments have none, and a
+    substring check finds that out faster than running the regex over them.
+    """
+    if "```" not in text:
+        return text
+    return _TRIPLE_BACKTICK_RE.sub("", text)
 
 
 # ─── Tokenizers ───────────────────────────────────────────────────────────────
 
+# Loading UniDic takes far longer than parsing a lookup term, so one tagger is
+# kept for the life of the process. A tagger is not safe to share between
+# threads mid-parse, so parses are serialized with a thread lock.
+_ja_tagger: MeCab.Tagger | None = None
+_ja_tagger_lock = threading.Lock()
+
+
+def _get_ja_tagger() -> MeCab.Tagger:
+    """
+    Return the shared MeCab tagger, loading UniDic on first use.
+    Callers must hold `_ja_tagger_lock`.
+    """
+    global _ja_tagger
+    if _ja_tagger is None:
+        dic_dir: str = unidic.DICDIR  # or unidic-lite
+        mecab_rc_path: str = os.path.join(dic_dir, "mecabrc")
+        # Only surface forms are used, so the tagger prints just those.
+        _ja_tagger = MeCab.Tagger(f'-r "{mecab_rc_path}" -d "{dic_dir}" -Owakati')
+    return _ja_tagger
+
+
+# Kiwi loads its morphological model when constructed, so one instance is
+# kept as well. Its analysis results are self-contained, so only the first
+# construction needs the lock.
+_kiwi: Kiwi | None = None
+_kiwi_lock = threading.Lock()
+
+# Kiwi tags kept by the Korean tokenizer: nouns (NN*), verbs (VV),
+# adjectives (VA), foreign words (SL), and exclamations (IC).
+_KO_CONTENT_TAGS: frozenset[str] = frozenset(
+    {"NNG", "NNP", "NNB", "VV", "VA", "SL", "IC"}
+)
+
+
+# Content words of recently tokenized Korean phrases, least recently used
+# first.
+_KO_TOKEN_CACHE_SIZE = 2048
+_ko_token_cache: OrderedDict[str, tuple[str, ...]] = OrderedDict()
+_ko_token_cache_lock = threading.Lock()
+
+
+def _get_kiwi() -> Kiwi:
+    """Return the shared Kiwi analyzer, loading its model on first use."""
+    global _kiwi
+    with _kiwi_lock:
+        if _kiwi is None:
+            _kiwi = Kiwi()
+    return _kiwi
+
 
 def lookup_zh_ja_tokenizer(phrase: str, language_code: str) -> list[str]:
     """
@@ -66,41 +176,36 @@ def lookup_zh_ja_tokenizer(phrase: str, language_code: str) -> list[str]:
 
     def is_valid_token(token: str) -> bool:
         """Returns True if the token is not a punctuation character."""
-        return not re.match(
-            r"""[.!/_,$%^*+\"\'\[\]—！，。？、~@#￥…&（）：「」『』《》»％〔〕；]+""",
-            token,
-        )
+        return not token or token[0] not in _PUNCTUATION_CHARS
 
     tokens: list[str] = []
 
     if language_code == "zh":
-        from ziwen_lookup.zh import simplify
-
         simplified_phrase = simplify(phrase)
-        simplified_tokens: list[str] = list(jieba.cut(simplified_phrase))
+        # rjieba builds the whole token list on the Rust side already.
+        simplified_tokens: list[str] = jieba.cut(simplified_phrase)
 
-        # Map simplified tokens back to original Traditional Chinese characters
-        original_idx = 0
-        for simp_token in simplified_tokens:
-            token_len = len(simp_token)
-            original_token = phrase[original_idx : original_idx + token_len]
-            tokens.append(original_token)
-            original_idx += token_len
+        if simplified_phrase == phrase:
+            # Already Simplified, so the tokens are the original text.
+            tokens = simplified_tokens
+        else:
+            # Map simplified tokens back to original Traditional Chinese characters
+            original_idx = 0
+            for simp_token in simplified_tokens:
+                token_len = len(simp_token)
+                original_token = phrase[original_idx : original_idx + token_len]
+                tokens.append(original_token)
+                original_idx += token_len
 
     elif language_code == "ja":
-        dic_dir: str = unidic.DICDIR  # or unidic-lite
-        mecab_rc_path: str = os.path.join(dic_dir, "mecabrc")
-        tagger: MeCab.Tagger = MeCab.Tagger(f'-r "{mecab_rc_path}" -d "{dic_dir}"')
-        tagger.parse(phrase)  # Workaround for Unicode bug in MeCab
-        node: Any = tagger.parseToNode(phrase.strip())
-        while node:
-            surface: str = node.surface
+        # One parse returns every surface form separated by spaces, which
+        # saves walking the node list one SWIG call at a time.
+        with _ja_tagger_lock:
+            parsed: str = _get_ja_tagger().parse(phrase.strip())
+        for surface in parsed.split():
             # Exclude single-character kana
-            if surface and not (
-                len(surface) == 1 and re.match(r"[\u3040-\u309f]", surface)
-            ):
+            if not (len(surface) == 1 and "\u3040" <= surface <= "\u309f"):
                 tokens.append(surface)
-            node = node.next
 
     else:
         raise ValueError("Unsupported language code. Use 'zh' or 'ja'.")
@@ -108,6 +213,34 @@ def lookup_zh_ja_tokenizer(phrase: str, language_code: str) -> list[str]:
     return [token for token in tokens if is_valid_token(token)]
 
 
+def lookup_zh_ja_tokenizer_batch(
+    phrases: list[str], language_code: str
+) -> list[list[str]]:
+    """
+    Tokenizes several phrases, as `lookup_zh_ja_tokenizer` does for one.
+    Chinese phrases are joined and segmented by Jieba in a single pass,
+    then split back apart; Japanese phrases are parsed one at a time, since
+    MeCab segments a run differently depending on the text around it.
+
+    :param phrases: The texts to be tokenized.
+    :param language_code: Language code, either 'zh' or 'ja'.
+    :return: A list of tokens for each phrase, in the same order.
+    """
+    if language_code == "zh" and len(phrases) > 1:
+        grouped: list[list[str]] = [[]]
+        for token in lookup_zh_ja_tokenizer(_RUN_SEPARATOR.join(phrases), "zh"):
+            if token == _RUN_SEPARATOR:
+                grouped.append([])
+            else:
+                grouped[-1].append(token)
+        # Should Jieba ever merge a separator into a word, the phrases are
+        # tokenized separately instead.
+        if len(grouped) == len(phrases):
+            return grouped
+
+    return [lookup_zh_ja_tokenizer(phrase, language_code) for phrase in phrases]
+
+
 def lookup_ko_tokenizer(phrase: str) -> list[str]:
     """
     Tokenizes a Korean phrase using Kiwi and returns only content words
@@ -119,18 +252,108 @@ def lookup_ko_tokenizer(phrase: str) -> list[str]:
     :param phrase: Korean text to tokenize
     :return: List of content words
     """
-    kiwi: Kiwi = Kiwi()
-    tokens = kiwi.tokenize(phrase, normalize_coda=True)
+    return lookup_ko_tokenizer_batch([phrase])[0]
+
+
+def lookup_ko_tokenizer_batch(phrases: list[str]) -> list[list[str]]:
+    """
+    Tokenizes several Korean phrases, as `lookup_ko_tokenizer` does for one.
+    Phrases seen recently are answered from memory, since lookups mostly
+    repeat the same short words; the rest are analyzed by Kiwi in a single
+    call rather than one call each.
+
+    :param phrases: Korean texts to tokenize.
+    :return: A list of content words for each phrase, in the same order.
+    """
+    known: dict[str, tuple[str, ...]] = {}
+    with _ko_token_cache_lock:
+        for phrase in phrases:
+            cached: tuple[str, ...] | None = _ko_token_cache.get(phrase)
+            if cached is not None:
+                _ko_token_cache.move_to_end(phrase)
+                known[phrase] = cached
+
+    misses: list[str] = [p for p in dict.fromkeys(phrases) if p not in known]
+    if misses:
+        analyses = list(_get_kiwi().tokenize(misses, normalize_coda=True))
+        with _ko_token_cache_lock:
+            for phrase, tokens in zip(misses, analyses, strict=True):
+                words = tuple(t.form for t in tokens if t.tag in _KO_CONTENT_TAGS)
+                known[phrase] = words
+                _ko_token_cache[phrase] = words
+                if len(_ko_token_cache) > _KO_TOKEN_CACHE_SIZE:
+                    _ko_token_cache.popitem(last=False)
 
-    # Keep nouns (NN*), verbs (VV), adjectives (VA),
-    # foreign words (SL), and exclamations (IC)
-    content_tags: set[str] = {"NNG", "NNP", "NNB", "VV", "VA", "SL", "IC"}
+    return [list(known[phrase]) for phrase in phrases]
 
-    return [token.form for token in tokens if token.tag in content_tags]
+
+# ─── Language code helpers ────────────────────────────────────────────────────
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_language_code(code: str) -> str:
+    """Returns the preferred code for a language code or name written in a
+    comment, or the input itself if it cannot be resolved. Results are
+    memoized, since the same handful of codes recur across comments."""
+    lingvo = converter(code)
+    return lingvo.preferred_code if lingvo is not None else code
+
+
+def _build_cjk_code_map(cjk_lang_dict: dict) -> dict[str, str]:
+    """
+    Flattens the CJK language settings into a lookup table from each
+    lowercased language code to its 2-letter CJK language code.
+
+    :param cjk_lang_dict: Language settings, or just their CJK_LANGUAGES section.
+    :return: Dictionary mapping codes such as 'yue' to 'zh', 'ja', or 'ko'.
+    """
+    if "CJK_LANGUAGES" in cjk_lang_dict:
+        cjk_lang_dict = cjk_lang_dict["CJK_LANGUAGES"]
+
+    code_map: dict[str, str] = {}
+    for lang_name, codes in cjk_lang_dict.items():
+        if not isinstance(codes, list):
+            continue
+        if "Chinese" in lang_name:
+            cjk_code = "zh"
+        elif "Japanese" in lang_name:
+            cjk_code = "ja"
+        elif "Korean" in lang_name:
+            cjk_code = "ko"
+        else:
+            continue
+        for code in codes:
+            # The first language listing a code wins, as before.
+            code_map.setdefault(code.lower(), cjk_code)
+
+    return code_map
+
+
+def get_cjk_code_map(force_refresh: bool = False) -> dict[str, str]:
+    """
+    Return the CJK code map built from the language settings, reading the
+    settings file only on first use.
+
+    :param force_refresh: If True, re-read the settings even if cached. Used
+                          when the settings file has been altered. Memoized
+                          language code resolutions are discarded as well.
+    :return: Dictionary mapping lowercased language codes to 'zh', 'ja', or 'ko'.
+    """
+    global _cjk_code_map_cache
+    if force_refresh:
+        _resolve_language_code.cache_clear()
+    if _cjk_code_map_cache is None or force_refresh:
+        _cjk_code_map_cache = _build_cjk_code_map(
+            load_settings(Paths.SETTINGS["LANGUAGES_SETTINGS"])
+        )
+    return _cjk_code_map_cache
 
 
 # ─── Main lookup matcher ──────────────────────────────────────────────────────
 
+_ZH_JA_CODES: frozenset[str] = frozenset({"zh", "ja"})
+_CJK_CODES: frozenset[str] = frozenset({"zh", "ja", "ko"})
+
 
 def lookup_matcher(
     content_text: str, language_code: str | None, disable_tokenization: bool = False
@@ -148,42 +371,28 @@ def lookup_matcher(
     :return: Dict mapping language code to list of terms.
     """
 
-    def map_cjk_code(cjk_code: str, cjk_lang_dict: dict) -> str:
-        """Map language codes to 2-letter CJK language codes if applicable."""
-        if "CJK_LANGUAGES" in cjk_lang_dict:
-            cjk_lang_dict = cjk_lang_dict["CJK_LANGUAGES"]
-
-        for lang_name, codes in cjk_lang_dict.items():
-            if not isinstance(codes, list):
-                continue
-            if cjk_code.lower() in [c.lower() for c in codes]:
-                if "Chinese" in lang_name:
-                    return "zh"
-                elif "Japanese" in lang_name:
-                    return "ja"
-                elif "Korean" in lang_name:
-                    return "ko"
-        return cjk_code
-
-    content_text = _remove_reddit_rich_text_escapes(str(content_text))
+    content_text = str(content_text)
+    # Most comments have no backticks at all and so nothing to look up.
+    if "`" not in content_text:
+        return {}
+
+    content_text = _remove_reddit_rich_text_escapes(content_text)
     original_text: str = content_text
 
     # Remove all triple-backtick blocks (```...```)
-    content_text = re.sub(r"```.*?```", "", content_text, flags=re.DOTALL)
+    content_text = _remove_triple_backtick_blocks(content_text)
 
-    cjk_languages: dict = load_settings(Paths.SETTINGS["LANGUAGES_SETTINGS"])
+    cjk_code_map: dict[str, str] = get_cjk_code_map()
 
     # ── Language code resolution ───────────────────────────────────────────────
 
     language_codes: list[str] = []
-    match: re.Match | None = re.search(r"!(?:identify|id):\s*(\S+)", original_text)
+    match: re.Match | None = _IDENTIFY_COMMAND_RE.search(original_text)
     if match:
         raw_codes: list[str] = match.group(1).split("+")
         for code in raw_codes:
-            _lingvo = converter(code)
-            mapped = map_cjk_code(
-                _lingvo.preferred_code if _lingvo is not None else code, cjk_languages
-            )
+            resolved: str = _resolve_language_code(code)
+            mapped = cjk_code_map.get(resolved.lower(), resolved)
             if mapped not in language_codes:
                 language_codes.append(mapped)
     elif language_code:
@@ -198,61 +407,66 @@ def lookup_matcher(
 
     # ── Backtick segment extraction ────────────────────────────────────────────
 
-    backtick_matches: list[re.Match] = list(
-        BACKTICK_LOOKUP_PATTERN.finditer(content_text)
+    # Each match is a (text, inline language, "!") tuple of group strings, with
+    # the groups that did not take part left empty.
+    backtick_matches: list[tuple[str, str, str]] = BACKTICK_LOOKUP_PATTERN.findall(
+        content_text
     )
 
-    match_details: list[tuple[str, str | None]] = [
-        (m.group(1), m.group(2)) for m in backtick_matches
-    ]
-    logger.debug(f"Backtick matches: {match_details}.")
-    logger.debug(f"Match count: {len(backtick_matches)}. Content text: {content_text}")
+    # Several of the messages below format whole lists, so they are only
+    # built when debug logging is on.
+    debug_logging: bool = logger.isEnabledFor(logging.DEBUG)
+    if debug_logging:
+        logger.debug(f"Backtick matches: {backtick_matches}.")
+        logger.debug(
+            f"Match count: {len(backtick_matches)}. Content text: {content_text}"
+        )
 
     matches: list[str] = []
     inline_language_codes: list[str | None] = []
 
-    for match_obj in backtick_matches:
-        text: str = match_obj.group(1)
-        inline_lang: str | None = match_obj.group(2)
+    for text, inline_lang, _ in backtick_matches:
         matches.append(text)
 
         if inline_lang:
-            _lingvo = converter(inline_lang)
-            mapped_inline = map_cjk_code(
-                _lingvo.preferred_code if _lingvo is not None else inline_lang,
-                cjk_languages,
-            )
+            resolved_inline: str = _resolve_language_code(inline_lang)
+            mapped_inline = cjk_code_map.get(resolved_inline.lower(), resolved_inline)
             inline_language_codes.append(mapped_inline)
-            logger.debug(f"Inline language found: {inline_lang} → {mapped_inline}")
+            if debug_logging:
+                logger.debug(f"Inline language found: {inline_lang} → {mapped_inline}")
         else:
             inline_language_codes.append(None)
-            logger.debug(f"No inline language for: {text}")
+            if debug_logging:
+                logger.debug(f"No inline language for: {text}")
 
     if not matches:
         logger.debug("No matches found after backtick extraction")
         return {}
 
-    logger.debug(
-        f"Segment language codes: {list(zip(matches, inline_language_codes, strict=True))}"
-    )
+    if debug_logging:
+        logger.debug(
+            f"Segment language codes: {list(zip(matches, inline_language_codes, strict=True))}"
+        )
 
-    # ── Per-segment processing ────────────────────────────────────────────────
+    # ── Segment planning ──────────────────────────────────────────────────────
 
-    result: dict[str, list[str | tuple[str, bool]]] = {}
+    # Each segment is classified first, so that the Hanzi runs of the whole
+    # comment can be tokenized together below.
+    segment_plans: list[
+        tuple[str, bool, bool, bool, bool, list[str], list[tuple[str, str | None]]]
+    ] = []
+    pending_runs: dict[str, dict[str, None]] = {"zh": {}, "ja": {}}
 
     for match_text, inline_lang in zip(matches, inline_language_codes, strict=True):
         is_explicit = inline_lang is not None
 
-        has_hanzi: bool = bool(
-            re.search(r"[\u2E80-\u9FFF\U00020000-\U0002EBEF]", match_text)
-        )
-        has_kana: bool = bool(re.search(r"[\u3041-\u309f\u30a0-\u30ff]", match_text))
-        has_hangul: bool = bool(re.search(r"[\uac00-\ud7af]", match_text))
+        has_hanzi, has_kana, has_hangul = _detect_scripts(match_text)
 
-        logger.debug(
-            f"Segment '{match_text}' - Hanzi: {has_hanzi}, Kana: {has_kana}, "
-            f"Hangul: {has_hangul}, Explicit: {is_explicit}"
-        )
+        if debug_logging:
+            logger.debug(
+                f"Segment '{match_text}' - Hanzi: {has_hanzi}, Kana: {has_kana}, "
+                f"Hangul: {has_hangul}, Explicit: {is_explicit}"
+            )
 
         seg_language_codes = [inline_lang] if inline_lang else language_codes
 
@@ -265,76 +479,123 @@ def lookup_matcher(
             elif has_hanzi:
                 seg_language_codes = ["zh"]
 
-        logger.debug(
-            f"Processing segment '{match_text}' with language codes: {seg_language_codes}"
+        # Tokenizing is only worth it for the languages the segment will be
+        # stored under; tokens for any other language would be discarded.
+        # Each run is paired with the tokenizer language it needs, if any.
+        hanzi_runs: list[tuple[str, str | None]] = []
+        if (
+            not disable_tokenization
+            and (has_hanzi or has_kana)
+            and ("zh" in seg_language_codes or "ja" in seg_language_codes)
+        ):
+            for token in _HANZI_RUN_RE.findall(match_text):
+                run_language: str | None = None
+                if len(token) >= 2:
+                    if "zh" in seg_language_codes and not has_kana:
+                        run_language = "zh"
+                    elif "ja" in seg_language_codes or has_kana:
+                        run_language = "ja"
+                if run_language:
+                    pending_runs[run_language][token] = None
+                hanzi_runs.append((token, run_language))
+
+        segment_plans.append(
+            (
+                match_text,
+                is_explicit,
+                has_hanzi,
+                has_kana,
+                has_hangul,
+                seg_language_codes,
+                hanzi_runs,
+            )
         )
 
-        if disable_tokenization:
-            for code in seg_language_codes:
-                result.setdefault(code, []).append((match_text, is_explicit))
+    # One Jieba call for all the comment's Chinese runs; Japanese runs are
+    # still parsed one by one.
+    run_tokens: dict[tuple[str, str], list[str]] = {}
+    for run_language, runs in pending_runs.items():
+        if runs:
+            run_list: list[str] = list(runs)
+            for run, tokens in zip(
+                run_list,
+                lookup_zh_ja_tokenizer_batch(run_list, run_language),
+                strict=True,
+            ):
+                run_tokens[(run_language, run)] = tokens
+
+    # ── Per-segment processing ────────────────────────────────────────────────
+
+    result: defaultdict[str, list[str | tuple[str, bool]]] = defaultdict(list)
+
+    for (
+        match_text,
+        is_explicit,
+        has_hanzi,
+        has_kana,
+        has_hangul,
+        seg_language_codes,
+        hanzi_runs,
+    ) in segment_plans:
+        if debug_logging:
             logger.debug(
-                f"Added untokenized text '{match_text}' (explicit={is_explicit}) for codes: {seg_language_codes}"
+                f"Processing segment '{match_text}' with language codes: {seg_language_codes}"
             )
-            continue
 
-        if has_hanzi or has_kana:
-            cjk_tokens: list[str] = []
-            segments: list[str] = re.findall(
-                r"[\u2E80-\u9FFF\U00020000-\U0002EBEF]+", match_text
-            )
-            cjk_tokens.extend(segments)
+        if disable_tokenization:
+            for code in seg_language_codes:
+                result[code].append((match_text, is_explicit))
+            if debug_logging:
+                logger.debug(
+                    f"Added untokenized text '{match_text}' (explicit={is_explicit}) for codes: {seg_language_codes}"
+                )
+            continue
 
+        if hanzi_runs:
             tokenized: list[str] = []
-            for token in cjk_tokens:
-                if len(token) >= 2:
-                    new_tokens: list[str]
-                    if "zh" in seg_language_codes and not has_kana:
-                        new_tokens = lookup_zh_ja_tokenizer(token, "zh")
-                    elif "ja" in seg_language_codes or has_kana:
-                        new_tokens = lookup_zh_ja_tokenizer(token, "ja")
-                    else:
-                        new_tokens = [token]
-                    tokenized.extend(new_tokens)
+            for token, run_language in hanzi_runs:
+                if run_language:
+                    tokenized.extend(run_tokens[(run_language, token)])
                 else:
                     tokenized.append(token)
 
+            tokenized_entries = [(token, is_explicit) for token in tokenized]
             for code in seg_language_codes:
-                if code in ["zh", "ja"]:
-                    result.setdefault(code, [])
-                    for token in tokenized:
-                        result[code].append((token, is_explicit))
-
-        if has_hangul:
-            hangul_segments: list[str] = re.findall(r"[\uac00-\ud7af]+", match_text)
-            hangul_tokens: list[str] = []
-            for segment in hangul_segments:
-                tokens: list[str] = lookup_ko_tokenizer(segment)
-                hangul_tokens.extend(tokens)
-
-            if "ko" in seg_language_codes:
-                result.setdefault("ko", [])
-                for token in hangul_tokens:
-                    result["ko"].append((token, is_explicit))
+                if code in _ZH_JA_CODES:
+                    result[code].extend(tokenized_entries)
+
+        if has_hangul and "ko" in seg_language_codes:
+            hangul_segments: list[str] = _HANGUL_RUN_RE.findall(match_text)
+            hangul_tokens: list[str] = [
+                token
+                for tokens in lookup_ko_tokenizer_batch(hangul_segments)
+                for token in tokens
+            ]
+
+            result["ko"].extend((token, is_explicit) for token in hangul_tokens)
+            if debug_logging:
                 logger.debug(
                     f"Added Korean tokens (explicit={is_explicit}): {hangul_tokens}"
                 )
 
-        all_cjk_codes: set[str] = {"zh", "ja", "ko"}
         non_cjk_codes: list[str] = [
-            code for code in seg_language_codes if code not in all_cjk_codes
+            code for code in seg_language_codes if code not in _CJK_CODES
         ]
         if non_cjk_codes:
             for code in non_cjk_codes:
-                result.setdefault(code, []).append((match_text, is_explicit))
+                result[code].append((match_text, is_explicit))
 
         elif not has_hanzi and not has_kana and not has_hangul:
             fallback_codes = seg_language_codes if seg_language_codes else ["unknown"]
             for code in fallback_codes:
-                result.setdefault(code, []).append((match_text, is_explicit))
-            logger.debug(
-                f"Non-CJK fallback: '{match_text}' stored under {fallback_codes}"
-            )
+                result[code].append((match_text, is_explicit))
+            if debug_logging:
+                logger.debug(
+                    f"Non-CJK fallback: '{match_text}' stored under {fallback_codes}"
+                )
 
-    logger.info(f"Lookup Matcher Result: {result}")
+    matched: dict[str, list[str | tuple[str, bool]]] = dict(result)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Lookup Matcher Result: {matched}")
 
-    return result
+    return matched
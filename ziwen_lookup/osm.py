@@ -7,21 +7,104 @@ Module to return search results for locations via OpenStreetMap.
 Logger tag: [L:OSM]
 """
 
+import functools
 import logging
+import threading
+import time
 from typing import Any
 from urllib.parse import quote
 
 import requests
 
 from config import logger as _base_logger
-from integrations.http import DEFAULT_HTTP_TIMEOUT
+from integrations.http import (
+    DEFAULT_HTTP_TIMEOUT,
+    RETRY_STATUS_CODES,
+    create_pooled_session,
+)
 
 logger = logging.LoggerAdapter(_base_logger, {"tag": "L:OSM"})
 
+# Keep-alive connections to Nominatim are reused between searches instead of
+# opening a new TCP/TLS connection per request. urllib3 does not retry here:
+# its backoff would not respect the rate limit below, so _fetch_nominatim
+# retries through the same gate as first attempts.
+_session = create_pooled_session(
+    {"User-Agent": "Python OSM Search Script"},
+    pool_connections=4,
+    pool_maxsize=8,
+    retries=0,
+)
+
+# Nominatim's usage policy allows at most one request per second, shared by
+# every thread of the bot. Rate-limit and server errors are retried up to
+# NOMINATIM_RETRIES times, honouring any Retry-After header.
+NOMINATIM_MIN_INTERVAL = 1.0
+NOMINATIM_RETRIES = 3
+_nominatim_lock = threading.Lock()
+_last_nominatim_request: float = 0.0
+
 
 # ─── Nominatim search ─────────────────────────────────────────────────────────
 
 
+def _wait_for_nominatim_slot(min_delay: float = 0.0) -> None:
+    """
+    Block until another request can be sent within Nominatim's rate limit.
+    The slot is reserved under the lock, but the wait happens outside it, so
+    callers queue up one interval apart without holding each other up.
+
+    :param min_delay: Seconds to wait at the least, such as a Retry-After value.
+    """
+    global _last_nominatim_request
+    with _nominatim_lock:
+        now: float = time.monotonic()
+        slot: float = max(
+            now + min_delay, _last_nominatim_request + NOMINATIM_MIN_INTERVAL
+        )
+        _last_nominatim_request = slot
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def _retry_after_seconds(response: requests.Response) -> float:
+    """Return the Retry-After delay of a response in seconds, or 0 if unset."""
+    try:
+        return max(float(response.headers.get("Retry-After", 0)), 0.0)
+    except ValueError:
+        # An HTTP date rather than a number; the usual interval applies.
+        return 0.0
+
+
+@functools.lru_cache(maxsize=512)
+def _fetch_nominatim(query: str, accept_language: str) -> tuple[dict[str, Any], ...]:
+    """
+    Fetch the raw Nominatim results for a query. Results for the same query
+    rarely change, so they are memoized; failed requests raise and are not.
+
+    :param query: Search query string.
+    :param accept_language: Language preference for the returned names.
+    :return: The result dictionaries, which must not be modified.
+    """
+    url: str = (
+        f"https://nominatim.openstreetmap.org/search?q={quote(query)}"
+        f"&accept-language={accept_language}&format=jsonv2"
+    )
+    retry_after: float = 0.0
+    for attempt in range(NOMINATIM_RETRIES + 1):
+        _wait_for_nominatim_slot(retry_after)
+        response = _session.get(url, timeout=DEFAULT_HTTP_TIMEOUT)
+        if (
+            response.status_code not in RETRY_STATUS_CODES
+            or attempt == NOMINATIM_RETRIES
+        ):
+            break
+        logger.info(f"> Nominatim returned {response.status_code}, retrying.")
+        retry_after = _retry_after_seconds(response)
+    response.raise_for_status()
+    return tuple(response.json())
+
+
 def search_nominatim(
     query: str, accept_language: str = "en-US,en", coords: list[float] | None = None
 ) -> list[str]:
@@ -36,20 +119,10 @@ def search_nominatim(
     Returns:
         List of formatted result strings
     """
-    encoded_query: str = quote(query)
     logger.info(f"Initial query: {query!r}")
 
-    url: str = (
-        f"https://nominatim.openstreetmap.org/search?q={encoded_query}"
-        f"&accept-language={accept_language}&format=jsonv2"
-    )
-
-    headers: dict[str, str] = {"User-Agent": "Python OSM Search Script"}
-
     try:
-        response = requests.get(url, headers=headers, timeout=DEFAULT_HTTP_TIMEOUT)
-        response.raise_for_status()
-        results: list[dict[str, Any]] = response.json()
+        results: tuple[dict[str, Any], ...] = _fetch_nominatim(query, accept_language)
 
         if not results:
             logger.info(f"> No results found for {query}")
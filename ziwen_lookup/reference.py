@@ -16,17 +16,60 @@ import re
 import requests
 import waybackpy
 import yaml
-from lxml import html
+from lxml import etree, html
 from waybackpy import exceptions
 
 from config import Paths
 from config import logger as _base_logger
-from integrations.http import DEFAULT_HTTP_TIMEOUT, get_random_useragent
+from integrations.http import (
+    DEFAULT_HTTP_TIMEOUT,
+    create_pooled_session,
+    get_random_useragent,
+)
 from lang.languages import converter, get_lingvos
 from ziwen_lookup.wp_utils import wikipedia_page_url
 
 logger = logging.LoggerAdapter(_base_logger, {"tag": "L:REF"})
 
+# Keep-alive connections to the archived Ethnologue pages and SIL are reused
+# between lookups instead of opening a new TCP/TLS connection per request.
+# A fresh user agent is still picked for each request.
+_session = create_pooled_session()
+
+
+# ─── XPath queries and patterns ───────────────────────────────────────────────
+# Compiled once at import and reused for every parsed page.
+
+# SIL ISO 639-3 code pages
+_XP_SIL_HEADER = etree.XPath('//div[contains(@class,"region-content")]//h2/text()')
+_XP_SIL_CODE_SETS = etree.XPath("//table//tr/td[4]/text()")
+
+# Archived Ethnologue language pages
+_XP_LANGUAGE_EXISTS = etree.XPath(
+    '//div[contains(@class,"view-display-id-page")]/div/text()'
+)
+_XP_ALTERNATE_NAMES = etree.XPath(
+    '//div[contains(@class,"alternate-names")]/div[2]/div/text()'
+)
+_XP_POPULATION = etree.XPath(
+    '//div[contains(@class,"field-population")]/div[2]/div/p/text()'
+)
+# Page layouts changed over the years, so the country is looked for in turn.
+_XP_COUNTRY_QUERIES: tuple[etree.XPath, ...] = (
+    etree.XPath('//div[contains(@class,"a-language-of")]/div/div/h2/a/text()'),
+    etree.XPath('//div[contains(@class,"field-ethnologue-language-of")]//h2/a/text()'),
+    etree.XPath(
+        '//div[contains(text(), "A language of")]/..//a[contains(@href, "/country/")]/text()'
+    ),
+    etree.XPath('//h2[contains(., "A language of")]/a/text()'),
+)
+_XP_FAMILY = etree.XPath(
+    '//div[contains(@class,"field-name-language-classification-link")]//a/text()'
+)
+
+# Numbers such as "1,234,567" or "12.5" in population statements
+_POPULATION_NUMBER_RE = re.compile(r"\d{1,3}(?:,\d{3})*(?:\.\d+)?")
+
 
 # ─── Internal fetch helpers ───────────────────────────────────────────────────
 
@@ -43,7 +86,7 @@ def _fetch_sil_language_data(language_code: str) -> dict | None:
     logger.debug(f"Fetching URL: {url}")
 
     try:
-        response = requests.get(url, headers=get_random_useragent(), timeout=10)
+        response = _session.get(url, headers=get_random_useragent(), timeout=10)
         response.raise_for_status()
         logger.debug(f"Response status: {response.status_code}")
     except requests.RequestException as e:
@@ -52,7 +95,7 @@ def _fetch_sil_language_data(language_code: str) -> dict | None:
 
     tree = html.fromstring(response.content)
 
-    header_elements = tree.xpath('//div[contains(@class,"region-content")]//h2/text()')
+    header_elements = _XP_SIL_HEADER(tree)
     logger.debug(f"Header elements found: {header_elements}")
 
     if not header_elements:
@@ -63,7 +106,7 @@ def _fetch_sil_language_data(language_code: str) -> dict | None:
     logger.debug(f"Found header: {header_text}")
     name = header_text.split("[")[0].strip()
 
-    code_sets_elements = tree.xpath("//table//tr/td[4]/text()")
+    code_sets_elements = _XP_SIL_CODE_SETS(tree)
     logger.debug(f"Code sets found: {code_sets_elements}")
 
     if not code_sets_elements:
@@ -140,7 +183,6 @@ def _fetch_language_reference_data(lookup_url: str, language_code: str) -> dict
     :return: Dictionary containing language reference data, or None if unavailable
     """
     language_data = get_lingvos()  # Provides Lingvos
-    useragent = get_random_useragent()
     lingvo_object = language_data.get(language_code)
 
     if not lookup_url:
@@ -164,8 +206,8 @@ def _fetch_language_reference_data(lookup_url: str, language_code: str) -> dict
     ref_data: dict = {"language_code_3": language_code}
 
     try:
-        response = requests.get(
-            lookup_url, headers=useragent, timeout=DEFAULT_HTTP_TIMEOUT
+        response = _session.get(
+            lookup_url, headers=get_random_useragent(), timeout=DEFAULT_HTTP_TIMEOUT
         )
         response.raise_for_status()
         tree = html.fromstring(response.content)
@@ -184,9 +226,7 @@ def _fetch_language_reference_data(lookup_url: str, language_code: str) -> dict
         return None
 
     try:
-        language_exist = tree.xpath(
-            '//div[contains(@class,"view-display-id-page")]/div/text()'
-        )[0]
+        language_exist = _XP_LANGUAGE_EXISTS(tree)[0]
         if not language_exist:
             return None
     except IndexError:
@@ -195,9 +235,7 @@ def _fetch_language_reference_data(lookup_url: str, language_code: str) -> dict
     _lingvo = converter(language_code)
     ref_data["name"] = _lingvo.name if _lingvo is not None else language_code
     try:
-        alt_names_raw = tree.xpath(
-            '//div[contains(@class,"alternate-names")]/div[2]/div/text()'
-        )[0]
+        alt_names_raw = _XP_ALTERNATE_NAMES(tree)[0]
         alt_names = [
             name.strip() for name in alt_names_raw.split(",") if "pej." not in name
         ]
@@ -207,12 +245,10 @@ def _fetch_language_reference_data(lookup_url: str, language_code: str) -> dict
         ref_data["name_alternates"] = []
 
     try:
-        population_text = tree.xpath(
-            '//div[contains(@class,"field-population")]/div[2]/div/p/text()'
-        )[0]
+        population_text = _XP_POPULATION(tree)[0]
         numbers = [
             int(n.replace(",", ""))
-            for n in re.findall(r"\d{1,3}(?:,\d{3})*(?:\.\d+)?", population_text)
+            for n in _POPULATION_NUMBER_RE.findall(population_text)
         ]
         ref_data["population"] = max(numbers) if numbers else 0
     except IndexError:
@@ -222,16 +258,11 @@ def _fetch_language_reference_data(lookup_url: str, language_code: str) -> dict
         ref_data["population"] = 0
 
     try:
-        country_list = (
-            tree.xpath('//div[contains(@class,"a-language-of")]/div/div/h2/a/text()')
-            or tree.xpath(
-                '//div[contains(@class,"field-ethnologue-language-of")]//h2/a/text()'
-            )
-            or tree.xpath(
-                '//div[contains(text(), "A language of")]/..//a[contains(@href, "/country/")]/text()'
-            )
-            or tree.xpath('//h2[contains(., "A language of")]/a/text()')
-        )
+        country_list: list = []
+        for query in _XP_COUNTRY_QUERIES:
+            country_list = query(tree)
+            if country_list:
+                break
 
         if country_list:
             ref_data["country"] = str(country_list[0]).strip()
@@ -243,9 +274,7 @@ def _fetch_language_reference_data(lookup_url: str, language_code: str) -> dict
         ref_data["country"] = ""
 
     try:
-        family_data = tree.xpath(
-            '//div[contains(@class,"field-name-language-classification-link")]//a/text()'
-        )[0]
+        family_data = _XP_FAMILY(tree)[0]
         ref_data["family"] = (
             family_data.split(",")[0].strip() if family_data else "Unknown"
         )
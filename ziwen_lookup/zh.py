@@ -9,6 +9,7 @@ Logger tag: [L:ZH]
 
 import asyncio
 import csv
+import functools
 import html as html_stdlib
 import json
 import logging
@@ -52,16 +53,24 @@ CALLIGRAPHY_TIMEOUT = (2, 2)
 # ─── Traditional/simplified conversion ─────────────────────────────────────────────
 
 
+@functools.cache
+def _opencc_converter(config: str) -> opencc.OpenCC:
+    """Returns a shared OpenCC converter for a configuration. Loading a
+    configuration reads its dictionaries, which costs far more than the
+    conversion of a lookup term."""
+    return opencc.OpenCC(config)
+
+
 def simplify(input_text: str) -> str:
     """Returns a simplified version (if available) of the input."""
-    used_converter = opencc.OpenCC("t2s.json")
+    used_converter = _opencc_converter("t2s.json")
 
     return used_converter.convert(input_text)
 
 
 def tradify(input_text: str) -> str:
     """Returns a traditional version (if available) of the input."""
-    used_converter = opencc.OpenCC("s2tw.json")
+    used_converter = _opencc_converter("s2tw.json")
 
     return used_converter.convert(input_text)
 